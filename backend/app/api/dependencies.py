@@ -1,5 +1,20 @@
-from fastapi import Header
+from fastapi import Header, Request
 
+from app.services import EventService, SummaryService
 
-def get_current_user_id(x_user_id: str | None = Header(default=None, alias="X-User-Id")) -> str:
+# Routers import these callables from here rather than redefining them, so FastAPI's
+# per-request dependency cache (keyed on the callable) resolves each one once.
+
+
+def get_current_user_id(
+    x_user_id: str | None = Header(default=None, alias="X-User-Id")
+) -> str:
     return x_user_id or "demo-user"
+
+
+def get_event_service(request: Request) -> EventService:
+    return request.app.state.event_service
+
+
+def get_summary_service(request: Request) -> SummaryService:
+    return request.app.state.summary_service
@@ -1,24 +1,20 @@
-from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 
-from app.api.dependencies import get_current_user_id
+from app.api.dependencies import get_current_user_id, get_event_service
 from app.models.event import Event, EventCreate, EventListResponse, EventStatus, EventUpdate
-from app.repositories.events import EventRepository, SortBy, SortOrder
+from app.repositories.events import SortBy, SortOrder, decode_cursor
+from app.services import EventService
 
 router = APIRouter(prefix="/events", tags=["events"])
 
 
-def get_event_repository(request: Request) -> EventRepository:
-    return request.app.state.events_repository
-
-
 @router.post("", response_model=Event, status_code=status.HTTP_201_CREATED)
 async def create_event(
     payload: EventCreate,
     user_id: str = Depends(get_current_user_id),
-    repository: EventRepository = Depends(get_event_repository),
+    service: EventService = Depends(get_event_service),
 ) -> Event:
-    payload = payload.model_copy(update={"user_id": user_id})
-    return await repository.create_event(payload)
+    return await service.create_event(user_id, payload)
 
 
 @router.get("", response_model=EventListResponse)
@@ -30,10 +26,18 @@ async def list_events(
     page_size: int = Query(default=20, ge=1, le=100),
     sort_by: SortBy = Query(default="start_date"),
     sort_order: SortOrder = Query(default="asc"),
+    after: str | None = Query(default=None),
     user_id: str = Depends(get_current_user_id),
-    repository: EventRepository = Depends(get_event_repository),
+    service: EventService = Depends(get_event_service),
 ) -> EventListResponse:
-    items, total = await repository.list_events(
+    try:
+        after_keys = (
+            decode_cursor(after, sort_by, sort_order) if after is not None else None
+        )
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor") from None
+
+    return await service.list_events(
         user_id=user_id,
         status=status,
         category=category,
@@ -42,17 +46,17 @@ async def list_events(
         page_size=page_size,
         sort_by=sort_by,
         sort_order=sort_order,
+        after=after_keys,
     )
-    return EventListResponse(items=items, page=page, page_size=page_size, total=total)
 
 
 @router.get("/{event_id}", response_model=Event)
 async def get_event(
     event_id: str,
     user_id: str = Depends(get_current_user_id),
-    repository: EventRepository = Depends(get_event_repository),
+    service: EventService = Depends(get_event_service),
 ) -> Event:
-    event = await repository.get_event(user_id, event_id)
+    event = await service.get_event(user_id, event_id)
     if event is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Event not found")
     return event
@@ -63,9 +67,9 @@ async def update_event(
     event_id: str,
     payload: EventUpdate,
     user_id: str = Depends(get_current_user_id),
-    repository: EventRepository = Depends(get_event_repository),
+    service: EventService = Depends(get_event_service),
 ) -> Event:
-    event = await repository.update_event(user_id, event_id, payload)
+    event = await service.update_event(user_id, event_id, payload)
     if event is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Event not found")
     return event
@@ -75,8 +79,8 @@ async def update_event(
 async def delete_event(
     event_id: str,
     user_id: str = Depends(get_current_user_id),
-    repository: EventRepository = Depends(get_event_repository),
+    service: EventService = Depends(get_event_service),
 ) -> None:
-    deleted = await repository.delete_event(user_id, event_id)
+    deleted = await service.delete_event(user_id, event_id)
     if not deleted:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Event not found")
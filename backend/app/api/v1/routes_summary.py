@@ -1,30 +1,24 @@
-from fastapi import APIRouter, Depends, Query, Request
+from fastapi import APIRouter, Depends, Query
 
-from app.api.dependencies import get_current_user_id
+from app.api.dependencies import get_current_user_id, get_summary_service
 from app.models.event import SummaryFinancialResponse, SummaryOverviewResponse
-from app.repositories.events import EventRepository
+from app.services import SummaryService
 
 router = APIRouter(prefix="/summary", tags=["summary"])
 
 
-def get_event_repository(request: Request) -> EventRepository:
-    return request.app.state.events_repository
-
-
 @router.get("/overview", response_model=SummaryOverviewResponse)
 async def summary_overview(
     user_id: str = Depends(get_current_user_id),
-    repository: EventRepository = Depends(get_event_repository),
+    service: SummaryService = Depends(get_summary_service),
 ) -> SummaryOverviewResponse:
-    data = await repository.get_overview_summary(user_id=user_id)
-    return SummaryOverviewResponse(**data)
+    return await service.overview(user_id)
 
 
 @router.get("/financial", response_model=SummaryFinancialResponse)
 async def summary_financial(
     next_years: int = Query(default=5, ge=1, le=40),
     user_id: str = Depends(get_current_user_id),
-    repository: EventRepository = Depends(get_event_repository),
+    service: SummaryService = Depends(get_summary_service),
 ) -> SummaryFinancialResponse:
-    data = await repository.get_financial_summary(user_id=user_id, next_years=next_years)
-    return SummaryFinancialResponse(**data)
+    return await service.financial(user_id, next_years=next_years)
@@ -0,0 +1,67 @@
+from time import monotonic
+from typing import Any
+
+
+class UserTTLCache:
+    """Short-lived per-user values, dropped whenever one of the user's events changes.
+
+    Callers take ``stamp()`` before computing a value and pass it to ``set``; the store is
+    skipped when the user was invalidated in between, so a result computed across a write
+    never outlives it. Memory is bounded by ``max_users`` (oldest user evicted first) and
+    ``max_keys_per_user`` (expired, then oldest keys dropped first).
+    """
+
+    def __init__(
+        self, ttl_seconds: float, max_users: int, max_keys_per_user: int = 64
+    ) -> None:
+        self._ttl = ttl_seconds
+        self._max_users = max_users
+        self._max_keys_per_user = max_keys_per_user
+        # user_id -> (stamp of the user's last invalidation, {key: (expires_at, value)})
+        self._entries: dict[str, tuple[int, dict[Any, tuple[float, Any]]]] = {}
+        # Bumped on every invalidation.
+        self._clock = 0
+        # Newest invalidation stamp among evicted users; stands in for users not tracked.
+        self._evicted_through = 0
+
+    def stamp(self) -> int:
+        return self._clock
+
+    def get(self, user_id: str, key: Any) -> Any | None:
+        entry = self._entries.get(user_id)
+        if entry is None:
+            return None
+        cached = entry[1].get(key)
+        if cached is not None and cached[0] > monotonic():
+            return cached[1]
+        return None
+
+    def set(self, user_id: str, key: Any, value: Any, stamp: int) -> None:
+        entry = self._entries.get(user_id)
+        invalidated_at = entry[0] if entry is not None else self._evicted_through
+        if invalidated_at > stamp:
+            return
+        if entry is None:
+            entry = self._add(user_id, invalidated_at)
+        values = entry[1]
+        now = monotonic()
+        if key not in values and len(values) >= self._max_keys_per_user:
+            stale = [k for k, (expires_at, _) in values.items() if expires_at <= now]
+            for stale_key in stale:
+                del values[stale_key]
+            if len(values) >= self._max_keys_per_user:
+                del values[next(iter(values))]
+        values[key] = (now + self._ttl, value)
+
+    def invalidate(self, user_id: str) -> None:
+        self._clock += 1
+        self._entries.pop(user_id, None)
+        self._add(user_id, self._clock)
+
+    def _add(self, user_id: str, invalidated_at: int) -> tuple[int, dict]:
+        if len(self._entries) >= self._max_users:
+            evicted_at, _ = self._entries.pop(next(iter(self._entries)))
+            self._evicted_through = max(self._evicted_through, evicted_at)
+        entry: tuple[int, dict] = (invalidated_at, {})
+        self._entries[user_id] = entry
+        return entry
@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -12,8 +14,22 @@ class Settings(BaseSettings):
     mongo_uri: str = "mongodb://localhost:27017"
     mongo_db_name: str = "sanchara"
     mongo_collection_events: str = "events"
+    mongo_collection_event_summaries: str = "event_summaries"
+    mongo_max_pool_size: int = 50
+    mongo_min_pool_size: int = 10
+    mongo_server_selection_timeout_ms: int = 5000
+    mongo_compressors: str = "zstd,zlib"
+
+    list_count_cache_ttl_seconds: float = 30.0
+    list_count_cache_max_users: int = 10_000
+    summary_cache_ttl_seconds: float = 30.0
+    summary_cache_max_users: int = 10_000
 
-    model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8")
+    model_config = SettingsConfigDict(
+        env_file=".env", env_file_encoding="utf-8", frozen=True
+    )
 
 
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    return Settings()
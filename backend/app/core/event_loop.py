@@ -0,0 +1,18 @@
+import asyncio
+from collections.abc import Coroutine
+from typing import Any
+
+
+def run(main: Coroutine[Any, Any, Any]) -> Any:
+    """Run ``main`` to completion, on uvloop when it is installed.
+
+    The API server gets uvloop from uvicorn's loop selection; this covers standalone
+    entry points such as the scripts in ``scripts/``.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(main)
+
+    with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+        return runner.run(main)
@@ -1,14 +1,27 @@
 from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
 
-from app.core.config import settings
+from app.core.config import get_settings
 
 
 class MongoManager:
     def __init__(self) -> None:
         self._client: AsyncIOMotorClient | None = None
+        self._db_name: str | None = None
 
     def connect(self) -> None:
-        self._client = AsyncIOMotorClient(settings.mongo_uri)
+        if self._client is not None:
+            return
+        settings = get_settings()
+        self._db_name = settings.mongo_db_name
+        self._client = AsyncIOMotorClient(
+            settings.mongo_uri,
+            tz_aware=True,
+            appname=settings.app_name,
+            maxPoolSize=settings.mongo_max_pool_size,
+            minPoolSize=settings.mongo_min_pool_size,
+            serverSelectionTimeoutMS=settings.mongo_server_selection_timeout_ms,
+            compressors=settings.mongo_compressors,
+        )
 
     def close(self) -> None:
         if self._client is not None:
@@ -19,7 +32,7 @@ class MongoManager:
     def db(self) -> AsyncIOMotorDatabase:
         if self._client is None:
             raise RuntimeError("Mongo client is not connected")
-        return self._client[settings.mongo_db_name]
+        return self._client[self._db_name]
 
 
 mongo_manager = MongoManager()
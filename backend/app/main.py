@@ -1,34 +1,54 @@
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
+from fastapi import Depends, FastAPI, Request
+from fastapi.responses import JSONResponse
 
 from app.api.v1.routes_events import router as events_router
 from app.api.v1.routes_health import router as health_router
 from app.api.v1.routes_summary import router as summary_router
-from app.core.config import settings
+from app.core.config import Settings, get_settings
 from app.db.mongo import mongo_manager
-from app.repositories.events import MongoEventRepository
+from app.repositories.events import EventRepository, MongoEventRepository
+from app.repositories.in_memory import InMemoryEventRepository
+from app.services import EventService, SummaryService
+from app.services.errors import ServiceValidationError
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    if settings.app_env == "test":
-        yield
-        return
-
-    mongo_manager.connect()
-    app.state.events_repository = MongoEventRepository(mongo_manager.db)
-    await app.state.events_repository.ensure_indexes()
+    repository: EventRepository
+    if get_settings().app_env == "test":
+        repository = InMemoryEventRepository()
+    else:
+        mongo_manager.connect()
+        repository = MongoEventRepository(mongo_manager.db)
+    await repository.ensure_indexes()
+
+    attach_services(app, repository)
     yield
     mongo_manager.close()
 
 
-app = FastAPI(title=settings.app_name, lifespan=lifespan)
+def attach_services(app: FastAPI, repository: EventRepository) -> None:
+    # Built once per process and shared by every request.
+    app.state.events_repository = repository
+    app.state.summary_service = SummaryService(repository)
+    app.state.event_service = EventService(repository, app.state.summary_service)
+
+
+app = FastAPI(title=get_settings().app_name, lifespan=lifespan)
 app.include_router(health_router, prefix="/api/v1")
 app.include_router(events_router, prefix="/api/v1")
 app.include_router(summary_router, prefix="/api/v1")
 
 
+@app.exception_handler(ServiceValidationError)
+async def service_validation_error_handler(
+    request: Request, exc: ServiceValidationError
+) -> JSONResponse:
+    return JSONResponse(status_code=422, content={"detail": str(exc)})
+
+
 @app.get("/", summary="Root")
-async def root() -> dict[str, str]:
+async def root(settings: Settings = Depends(get_settings)) -> dict[str, str]:
     return {"app": settings.app_name, "status": "running"}
@@ -1,6 +1,7 @@
 from app.models.event import (
     Event,
     EventCreate,
+    EventListItem,
     EventListResponse,
     EventPriority,
     EventStatus,
@@ -12,6 +13,7 @@ from app.models.event import (
 __all__ = [
     "Event",
     "EventCreate",
+    "EventListItem",
     "EventListResponse",
     "EventPriority",
     "EventStatus",
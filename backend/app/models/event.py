@@ -1,7 +1,7 @@
 from datetime import date, datetime, timezone
 from enum import Enum
 
-from pydantic import BaseModel, Field, computed_field, model_validator
+from pydantic import BaseModel, ConfigDict, Field, computed_field, model_validator
 
 
 class EventStatus(str, Enum):
@@ -16,6 +16,35 @@ class EventPriority(str, Enum):
     high = "high"
     critical = "critical"
 
+    @property
+    def rank(self) -> int:
+        """Sort rank, stored on Mongo documents as ``priority_rank``."""
+        return _PRIORITY_RANKS[self]
+
+
+_PRIORITY_RANKS = {
+    EventPriority.low: 1,
+    EventPriority.medium: 2,
+    EventPriority.high: 3,
+    EventPriority.critical: 4,
+}
+
+
+def compute_savings_progress_pct(
+    is_financial: bool, savings_target: float | None, amount_saved: float | None
+) -> float | None:
+    if not is_financial or not savings_target or savings_target <= 0:
+        return None
+    return min(100.0, round(((amount_saved or 0) / savings_target) * 100, 2))
+
+
+def compute_is_fully_funded(
+    is_financial: bool, savings_target: float | None, amount_saved: float | None
+) -> bool | None:
+    if not is_financial or not savings_target or savings_target <= 0:
+        return None
+    return (amount_saved or 0) >= savings_target
+
 
 class EventBase(BaseModel):
     user_id: str = Field(default="demo-user", min_length=1, max_length=120)
@@ -47,6 +76,13 @@ class EventCreate(EventBase):
 
 
 class EventUpdate(BaseModel):
+    """Partial update: omitted fields are kept, explicit nulls clear the stored value.
+
+    Only optional fields can be cleared; the service validates cross-field rules against
+    the event as it will be stored, so clearing ``savings_target`` on a financial event
+    is rejected just like creating one without it.
+    """
+
     title: str | None = Field(default=None, min_length=1, max_length=200)
     category: str | None = Field(default=None, min_length=1, max_length=100)
     start_date: date | None = None
@@ -63,6 +99,31 @@ class EventUpdate(BaseModel):
     amount_saved: float | None = Field(default=None, ge=0)
     linked_event_ids: list[str] | None = None
 
+    @model_validator(mode="after")
+    def reject_null_required_fields(self) -> "EventUpdate":
+        nulls = sorted(
+            field
+            for field in _NON_NULLABLE_UPDATE_FIELDS & self.model_fields_set
+            if getattr(self, field) is None
+        )
+        if nulls:
+            raise ValueError(f"{', '.join(nulls)} cannot be null")
+        return self
+
+
+# Update fields that are required on a stored event: they may be omitted, never nulled.
+_NON_NULLABLE_UPDATE_FIELDS = frozenset(
+    {
+        "title",
+        "category",
+        "start_date",
+        "status",
+        "priority",
+        "is_financial",
+        "linked_event_ids",
+    }
+)
+
 
 class Event(EventBase):
     id: str
@@ -73,25 +134,54 @@ class Event(EventBase):
     @computed_field
     @property
     def savings_progress_pct(self) -> float | None:
-        if not self.is_financial or not self.savings_target or self.savings_target <= 0:
-            return None
-        amount_saved = self.amount_saved or 0
-        return min(100.0, round((amount_saved / self.savings_target) * 100, 2))
+        return compute_savings_progress_pct(
+            self.is_financial, self.savings_target, self.amount_saved
+        )
 
     @computed_field
     @property
     def is_fully_funded(self) -> bool | None:
-        if not self.is_financial or not self.savings_target or self.savings_target <= 0:
-            return None
-        amount_saved = self.amount_saved or 0
-        return amount_saved >= self.savings_target
+        return compute_is_fully_funded(
+            self.is_financial, self.savings_target, self.amount_saved
+        )
+
+
+class EventListItem(BaseModel):
+    """Event row for list responses: no long text fields, funding figures precomputed."""
+
+    model_config = ConfigDict(extra="ignore")
+
+    id: str
+    user_id: str
+    title: str
+    category: str
+    start_date: date
+    end_date: date | None = None
+    status: EventStatus
+    priority: EventPriority
+    timeline_phase: str | None = None
+    is_financial: bool = False
+    savings_target: float | None = None
+    amount_saved: float | None = None
+    created_at: datetime
+    savings_progress_pct: float | None = None
+    is_fully_funded: bool | None = None
+
+    @classmethod
+    def from_event(cls, event: Event) -> "EventListItem":
+        return cls.model_construct(
+            **{name: getattr(event, name) for name in cls.model_fields}
+        )
 
 
 class EventListResponse(BaseModel):
-    items: list[Event]
+    items: list[EventListItem]
     page: int
     page_size: int
-    total: int
+    # Not computed for cursor (``after``) requests.
+    total: int | None
+    has_next: bool = False
+    next_cursor: str | None = None
 
 
 class SummaryOverviewResponse(BaseModel):
@@ -1,23 +1,205 @@
-from datetime import date, datetime, timezone
-from typing import Literal, Protocol
+import asyncio
+import base64
+import json
+from collections.abc import Callable
+from datetime import date, datetime, time, timezone
+from functools import lru_cache
+from typing import Any, Literal, Protocol
+from urllib.parse import unquote
 
 from bson import ObjectId
+from bson.errors import InvalidId
 from motor.motor_asyncio import AsyncIOMotorDatabase
-from pymongo import ASCENDING, DESCENDING
-
-from app.core.config import settings
-from app.models.event import Event, EventCreate, EventStatus, EventUpdate
+from pymongo import ASCENDING, DESCENDING, IndexModel, ReturnDocument, UpdateOne
+from pymongo.errors import OperationFailure
+
+from app.core.cache import UserTTLCache
+from app.core.config import get_settings
+from app.models.event import (
+    Event,
+    EventCreate,
+    EventListItem,
+    EventPriority,
+    EventStatus,
+    EventUpdate,
+    compute_is_fully_funded,
+    compute_savings_progress_pct,
+)
 
 SortBy = Literal["start_date", "priority", "created_at"]
 SortOrder = Literal["asc", "desc"]
 
-_PRIORITY_RANK = {
-    "low": 1,
-    "medium": 2,
-    "high": 3,
-    "critical": 4,
+# Internal fields that never leave the repository; excluded server-side on every read.
+_EVENT_PROJECTION = {"priority_rank": 0}
+
+# Stored fields behind an ``EventListItem``; notes/description and costs stay server-side.
+_LIST_PROJECTION = {
+    "user_id": 1,
+    "title": 1,
+    "category": 1,
+    "start_date": 1,
+    "end_date": 1,
+    "status": 1,
+    "priority": 1,
+    "timeline_phase": 1,
+    "is_financial": 1,
+    "savings_target": 1,
+    "amount_saved": 1,
+    "created_at": 1,
+}
+
+# Stored fields an event contributes to its user's summary document.
+_SUMMARY_PROJECTION = {
+    "status": 1,
+    "timeline_phase": 1,
+    "is_financial": 1,
+    "savings_target": 1,
+    "amount_saved": 1,
 }
 
+# Single-field indexes superseded by the compound indexes in ``ensure_indexes``.
+_LEGACY_INDEXES = (
+    "user_id_1",
+    "status_1",
+    "category_1",
+    "start_date_1",
+    "timeline_phase_1",
+    "deleted_at_1",
+)
+
+# ``_id`` of the marker written once every user's summary has been rebuilt; user ids are
+# strings, so an integer id cannot collide with a user's summary document.
+_SUMMARIES_SEEDED_MARKER = 0
+
+# Server error code for dropping an index that does not exist.
+_INDEX_NOT_FOUND = 27
+
+
+def _bson_now() -> datetime:
+    """Current UTC time truncated to the millisecond precision BSON datetimes keep.
+
+    Events returned from a write are built from local values, so they must match what a
+    later read of the stored document returns.
+    """
+    now = datetime.now(timezone.utc)
+    return now.replace(microsecond=now.microsecond // 1000 * 1000)
+
+
+def _parse_object_id(event_id: str) -> ObjectId | None:
+    """Parse ``event_id`` once, returning ``None`` when it is not a valid ObjectId."""
+    # ObjectId(None) would mint a fresh id rather than fail.
+    if event_id is None:
+        return None
+    try:
+        return ObjectId(event_id)
+    except (InvalidId, TypeError):
+        return None
+
+
+def _to_bson_date(value: date) -> datetime:
+    """Store calendar dates as UTC-midnight BSON dates."""
+    return datetime.combine(value, time.min, tzinfo=timezone.utc)
+
+
+@lru_cache(maxsize=8)
+def _filter_builder(
+    has_status: bool, has_category: bool, has_year: bool
+) -> Callable[[str, EventStatus | None, str | None, int | None], dict]:
+    """Return the list filter builder for one combination of supplied filters.
+
+    There are only eight filter shapes, so each builder is created once and the
+    per-request work is a straight dict build without re-checking every filter.
+    """
+
+    def build(user_id: str, status: EventStatus | None, category: str | None, year: int | None) -> dict:
+        query: dict = {"deleted_at": None, "user_id": user_id}
+        if has_status:
+            query["status"] = status.value
+        if has_category:
+            query["category"] = category
+        if has_year:
+            query["start_date"] = {
+                "$gte": datetime(year, 1, 1, tzinfo=timezone.utc),
+                "$lt": datetime(year + 1, 1, 1, tzinfo=timezone.utc),
+            }
+        return query
+
+    return build
+
+
+def _summary_key(value: str) -> str:
+    """Escape a breakdown key (e.g. a free-text timeline phase) for a dotted ``$inc`` path."""
+    return value.replace("%", "%25").replace(".", "%2E").replace("$", "%24")
+
+
+def _summary_counts(counts: dict | None) -> dict[str, int]:
+    return {unquote(key): count for key, count in (counts or {}).items() if count}
+
+
+def _summary_contribution(doc: dict) -> dict[str, float]:
+    """Return what one live event adds to its user's ``event_summaries`` document."""
+    contribution: dict[str, float] = {"total_events": 1}
+    if doc.get("status"):
+        contribution[f"by_status.{_summary_key(EventStatus(doc['status']).value)}"] = 1
+    if doc.get("timeline_phase"):
+        contribution[f"by_timeline_phase.{_summary_key(doc['timeline_phase'])}"] = 1
+    if doc.get("is_financial"):
+        target = float(doc.get("savings_target") or 0)
+        saved = float(doc.get("amount_saved") or 0)
+        contribution["total_savings_target"] = target
+        contribution["total_amount_saved"] = saved
+        contribution["fully_funded_events"] = int(target > 0 and saved >= target)
+    return contribution
+
+
+def _summary_delta(before: dict | None, after: dict | None) -> dict[str, float]:
+    """``$inc`` amounts for an event changing from ``before`` to ``after`` (None = not live)."""
+    delta = _summary_contribution(after) if after is not None else {}
+    if before is not None:
+        for field, amount in _summary_contribution(before).items():
+            delta[field] = delta.get(field, 0) - amount
+    return {field: amount for field, amount in delta.items() if amount}
+
+
+def encode_cursor(
+    event: Event | EventListItem, sort_by: SortBy, sort_order: SortOrder
+) -> str:
+    """Encode the sort position of ``event`` as an opaque ``after`` cursor."""
+    if sort_by == "priority":
+        keys = [event.priority.value, event.start_date.isoformat()]
+    else:
+        keys = [getattr(event, sort_by).isoformat()]
+    values = [sort_by, sort_order, *keys, event.id]
+    return base64.urlsafe_b64encode(json.dumps(values).encode()).decode()
+
+
+def decode_cursor(cursor: str, sort_by: SortBy, sort_order: SortOrder) -> tuple[Any, ...]:
+    """Decode an ``after`` cursor into typed sort key values, ending with the event id.
+
+    Raises ``ValueError`` when the cursor is malformed or was issued for another sort.
+    """
+    values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    expected = 5 if sort_by == "priority" else 4
+    if (
+        not isinstance(values, list)
+        or len(values) != expected
+        or not all(isinstance(value, str) for value in values)
+    ):
+        raise ValueError("invalid cursor")
+    if values[:2] != [sort_by, sort_order]:
+        raise ValueError("cursor was issued for a different sort")
+
+    keys = values[2:]
+    if sort_by == "priority":
+        return EventPriority(keys[0]), date.fromisoformat(keys[1]), keys[2]
+    if sort_by == "start_date":
+        return date.fromisoformat(keys[0]), keys[1]
+    created_at = datetime.fromisoformat(keys[0])
+    # Stored timestamps are UTC; a naive value cannot be compared with them.
+    if created_at.tzinfo is None:
+        raise ValueError("cursor created_at must include a UTC offset")
+    return created_at, keys[1]
+
 
 class EventRepository(Protocol):
     async def ensure_indexes(self) -> None: ...
@@ -34,7 +216,10 @@ class EventRepository(Protocol):
         page_size: int = 20,
         sort_by: SortBy = "start_date",
         sort_order: SortOrder = "asc",
-    ) -> tuple[list[Event], int]: ...
+        after: tuple[Any, ...] | None = None,
+    ) -> tuple[list[EventListItem], int | None, bool]:
+        """Return ``(items, total, has_next)``; ``total`` is not computed in cursor mode."""
+        ...
 
     async def get_event(self, user_id: str, event_id: str) -> Event | None: ...
 
@@ -49,39 +234,193 @@ class EventRepository(Protocol):
 
 class MongoEventRepository:
     def __init__(self, db: AsyncIOMotorDatabase, collection_name: str | None = None) -> None:
+        settings = get_settings()
         self.collection = db[collection_name or settings.mongo_collection_events]
+        # Per-user rollups kept in step with every write; see ``_apply_summary_delta``.
+        self.summaries = db[settings.mongo_collection_event_summaries]
+        # Set at startup once a full rebuild has seeded every existing user's summary.
+        self._seed_new_summaries = False
+        # user_id -> {(status, category, year): total}
+        self._count_cache = UserTTLCache(
+            settings.list_count_cache_ttl_seconds, settings.list_count_cache_max_users
+        )
 
     async def ensure_indexes(self) -> None:
-        await self.collection.create_index([("user_id", ASCENDING)])
-        await self.collection.create_index([("status", ASCENDING)])
-        await self.collection.create_index([("category", ASCENDING)])
-        await self.collection.create_index([("start_date", ASCENDING)])
-        await self.collection.create_index([("timeline_phase", ASCENDING)])
-        await self.collection.create_index([("deleted_at", ASCENDING)])
+        # Equality (user_id, deleted_at[, filter]) -> Sort (start_date/rank) -> _id tiebreak.
+        # Sent as one createIndexes command so startup costs a single round trip.
+        scope = [("user_id", ASCENDING), ("deleted_at", ASCENDING)]
+        by_start = [("start_date", ASCENDING), ("_id", ASCENDING)]
+        await self.collection.create_indexes(
+            [
+                IndexModel([*scope, *by_start]),
+                IndexModel([*scope, ("created_at", ASCENDING), ("_id", ASCENDING)]),
+                # Priority ties always run by start_date/_id ascending, so each direction
+                # needs its own index (neither is the reverse of the other).
+                IndexModel([*scope, ("priority_rank", ASCENDING), *by_start]),
+                IndexModel([*scope, ("priority_rank", DESCENDING), *by_start]),
+                IndexModel([*scope, ("status", ASCENDING), *by_start]),
+                IndexModel([*scope, ("category", ASCENDING), *by_start]),
+                # Financial summary: only financial events are indexed, keeping it small.
+                IndexModel(
+                    [*scope, ("start_date", ASCENDING)],
+                    name="financial_user_deleted_at_start_date",
+                    partialFilterExpression={"is_financial": True},
+                ),
+            ]
+        )
+
+        # Dropped only once their replacements exist, so queries never lose index cover.
+        existing = await self.collection.index_information()
+        stale = [name for name in _LEGACY_INDEXES if name in existing]
+        await asyncio.gather(*(self._drop_index(name) for name in stale))
+
+        marker = await self.summaries.find_one({"_id": _SUMMARIES_SEEDED_MARKER})
+        self._seed_new_summaries = marker is not None
+
+    async def _drop_index(self, name: str) -> None:
+        try:
+            await self.collection.drop_index(name)
+        except OperationFailure as exc:
+            # Another worker starting at the same time may have dropped it first.
+            if exc.code != _INDEX_NOT_FOUND:
+                raise
 
     @staticmethod
-    def _doc_to_event(doc: dict) -> Event:
+    def _coerce_doc(doc: dict) -> dict:
+        """Apply BSON-to-model coercions in place.
+
+        Documents are validated on write, so models are built from them with
+        ``model_construct`` instead of re-running validation.
+        """
         doc["id"] = str(doc.pop("_id"))
-        doc.pop("priority_rank", None)
-        return Event(**doc)
+        for field in ("start_date", "end_date"):
+            if doc.get(field) is not None:
+                doc[field] = doc[field].date()
+        doc["status"] = EventStatus(doc["status"])
+        doc["priority"] = EventPriority(doc["priority"])
+        return doc
+
+    @classmethod
+    def _doc_to_event(cls, doc: dict) -> Event:
+        return Event.model_construct(**cls._coerce_doc(doc))
+
+    @classmethod
+    def _doc_to_list_item(cls, doc: dict) -> EventListItem:
+        doc = cls._coerce_doc(doc)
+        funding = (
+            doc.get("is_financial", False),
+            doc.get("savings_target"),
+            doc.get("amount_saved"),
+        )
+        doc["savings_progress_pct"] = compute_savings_progress_pct(*funding)
+        doc["is_fully_funded"] = compute_is_fully_funded(*funding)
+        return EventListItem.model_construct(**doc)
 
     @staticmethod
     def _base_query(user_id: str) -> dict:
         return {"deleted_at": None, "user_id": user_id}
 
-    async def create_event(self, payload: EventCreate) -> Event:
-        now = datetime.now(timezone.utc)
-        data = payload.model_dump(mode="json")
-        data["created_at"] = now.isoformat()
-        data["updated_at"] = now.isoformat()
+    @staticmethod
+    def _sort_spec(sort_by: SortBy, sort_order: SortOrder) -> list[tuple[str, int]]:
+        direction = ASCENDING if sort_order == "asc" else DESCENDING
+        if sort_by == "priority":
+            return [("priority_rank", direction), ("start_date", ASCENDING), ("_id", ASCENDING)]
+        return [(sort_by, direction), ("_id", direction)]
+
+    @staticmethod
+    def _cursor_bounds(sort_by: SortBy, after: tuple[Any, ...]) -> list | None:
+        *keys, event_id = after
+        oid = _parse_object_id(event_id)
+        if oid is None:
+            return None
+        if sort_by == "priority":
+            priority, start_date = keys
+            return [priority.rank, _to_bson_date(start_date), oid]
+        if sort_by == "start_date":
+            return [_to_bson_date(keys[0]), oid]
+        return [keys[0], oid]
+
+    @staticmethod
+    def _keyset_query(sort: list[tuple[str, int]], bounds: list) -> dict:
+        """Match documents strictly after ``bounds`` in ``sort`` order."""
+        clauses = []
+        for index, (field, direction) in enumerate(sort):
+            clause = {name: value for (name, _), value in zip(sort[:index], bounds[:index])}
+            clause[field] = {"$gt" if direction == ASCENDING else "$lt": bounds[index]}
+            clauses.append(clause)
+        return {"$or": clauses}
+
+    async def _count(self, user_id: str, key: tuple, query: dict) -> int:
+        """Return the filter's total, served from a short-lived per-user cache."""
+        cached = self._count_cache.get(user_id, key)
+        if cached is not None:
+            return cached
+
+        stamp = self._count_cache.stamp()
+        total = await self.collection.count_documents(query)
+        self._count_cache.set(user_id, key, total, stamp)
+        return total
+
+    def _invalidate_counts(self, user_id: str) -> None:
+        self._count_cache.invalidate(user_id)
+
+    @staticmethod
+    def _new_document(payload: EventCreate, now: datetime) -> dict:
+        data = payload.model_dump()
+        data["created_at"] = now
+        data["updated_at"] = now
         data["deleted_at"] = None
-        data["priority_rank"] = _PRIORITY_RANK.get(data.get("priority", "medium"), 2)
+        data["start_date"] = _to_bson_date(payload.start_date)
+        if payload.end_date is not None:
+            data["end_date"] = _to_bson_date(payload.end_date)
+        data["priority_rank"] = payload.priority.rank
+        return data
 
+    async def create_event(self, payload: EventCreate) -> Event:
+        data = self._new_document(payload, _bson_now())
         result = await self.collection.insert_one(data)
-        created = await self.collection.find_one({"_id": result.inserted_id, "deleted_at": None})
-        if not created:
-            raise RuntimeError("Failed to create event")
-        return self._doc_to_event(created)
+        self._invalidate_counts(payload.user_id)
+        await self._apply_summary_delta(payload.user_id, _summary_delta(None, data))
+        data["_id"] = result.inserted_id
+        return self._doc_to_event(data)
+
+    async def bulk_create_events(self, payloads: list[EventCreate]) -> list[Event]:
+        """Insert many events with a single unordered ``insert_many`` round trip."""
+        if not payloads:
+            return []
+        now = _bson_now()
+        docs = [self._new_document(payload, now) for payload in payloads]
+        # insert_many assigns each document's _id in place.
+        await self.collection.insert_many(docs, ordered=False)
+
+        deltas: dict[str, dict[str, float]] = {}
+        for doc in docs:
+            delta = deltas.setdefault(doc["user_id"], {})
+            for field, amount in _summary_delta(None, doc).items():
+                delta[field] = delta.get(field, 0) + amount
+        await self.summaries.bulk_write(
+            [
+                UpdateOne({"_id": user_id}, self._summary_update(delta), upsert=True)
+                for user_id, delta in deltas.items()
+            ],
+            ordered=False,
+        )
+        for user_id in deltas:
+            self._invalidate_counts(user_id)
+        return [self._doc_to_event(doc) for doc in docs]
+
+    def _summary_update(self, delta: dict[str, float]) -> dict:
+        # A document created here holds only this write's delta. That is the user's
+        # whole history only if every user with older events was already seeded by a
+        # rebuild; otherwise it stays unseeded and reads aggregate. The request path
+        # never seeds an existing document: it cannot see writes racing a rebuild.
+        return {"$inc": delta, "$setOnInsert": {"seeded": self._seed_new_summaries}}
+
+    async def _apply_summary_delta(self, user_id: str, delta: dict[str, float]) -> None:
+        if delta:
+            await self.summaries.update_one(
+                {"_id": user_id}, self._summary_update(delta), upsert=True
+            )
 
     async def list_events(
         self,
@@ -93,135 +432,255 @@ class MongoEventRepository:
         page_size: int = 20,
         sort_by: SortBy = "start_date",
         sort_order: SortOrder = "asc",
-    ) -> tuple[list[Event], int]:
-        query: dict = self._base_query(user_id)
-        if status is not None:
-            query["status"] = status.value
-        if category is not None:
-            query["category"] = category
-        if year is not None:
-            query["start_date"] = {
-                "$gte": date(year, 1, 1).isoformat(),
-                "$lt": date(year + 1, 1, 1).isoformat(),
-            }
-
-        total = await self.collection.count_documents(query)
-        skip = (page - 1) * page_size
-
-        if sort_by == "priority":
-            direction = 1 if sort_order == "asc" else -1
+        after: tuple[Any, ...] | None = None,
+    ) -> tuple[list[EventListItem], int | None, bool]:
+        build_query = _filter_builder(status is not None, category is not None, year is not None)
+        query = build_query(user_id, status, category, year)
+
+        sort = self._sort_spec(sort_by, sort_order)
+        # One extra row tells whether another page follows without a count; the batch size
+        # matches it so the whole page arrives in the first reply.
+        limit = page_size + 1
+
+        if after is not None:
+            # Cursor mode: no count query, the page is a keyset seek from the bound.
+            bounds = self._cursor_bounds(sort_by, after)
+            if bounds is None:
+                return [], None, False
             docs = await (
-                self.collection.aggregate(
-                    [
-                        {"$match": query},
-                        {"$sort": {"priority_rank": direction, "start_date": 1}},
-                        {"$skip": skip},
-                        {"$limit": page_size},
-                    ]
-                )
-            ).to_list(length=page_size)
+                self.collection.find({**query, **self._keyset_query(sort, bounds)}, _LIST_PROJECTION)
+                .sort(sort)
+                .limit(limit)
+                .batch_size(limit)
+                .to_list(length=limit)
+            )
+            total = None
         else:
-            direction = ASCENDING if sort_order == "asc" else DESCENDING
-            docs = await (
-                self.collection.find(query)
-                .sort(sort_by, direction)
-                .skip(skip)
-                .limit(page_size)
-                .to_list(length=page_size)
+            total, docs = await asyncio.gather(
+                self._count(user_id, (status, category, year), query),
+                self.collection.find(query, _LIST_PROJECTION)
+                .sort(sort)
+                .skip((page - 1) * page_size)
+                .limit(limit)
+                .batch_size(limit)
+                .to_list(length=limit),
             )
 
-        return [self._doc_to_event(doc) for doc in docs], total
+        has_next = len(docs) > page_size
+        return [self._doc_to_list_item(doc) for doc in docs[:page_size]], total, has_next
 
     async def get_event(self, user_id: str, event_id: str) -> Event | None:
-        if not ObjectId.is_valid(event_id):
+        oid = _parse_object_id(event_id)
+        if oid is None:
             return None
-        doc = await self.collection.find_one({"_id": ObjectId(event_id), **self._base_query(user_id)})
+        doc = await self.collection.find_one(
+            {"_id": oid, **self._base_query(user_id)}, _EVENT_PROJECTION
+        )
         if doc is None:
             return None
         return self._doc_to_event(doc)
 
     async def update_event(self, user_id: str, event_id: str, payload: EventUpdate) -> Event | None:
-        if not ObjectId.is_valid(event_id):
+        oid = _parse_object_id(event_id)
+        if oid is None:
             return None
 
-        updates = payload.model_dump(mode="json", exclude_unset=True)
+        updates = payload.model_dump(exclude_unset=True)
         if not updates:
             return await self.get_event(user_id, event_id)
 
-        if "priority" in updates:
-            updates["priority_rank"] = _PRIORITY_RANK.get(updates["priority"], 2)
+        for field in ("start_date", "end_date"):
+            value = getattr(payload, field)
+            if field in updates and value is not None:
+                updates[field] = _to_bson_date(value)
+
+        if payload.priority is not None:
+            updates["priority_rank"] = payload.priority.rank
 
-        updates["updated_at"] = datetime.now(timezone.utc).isoformat()
+        updates["updated_at"] = _bson_now()
 
-        result = await self.collection.update_one(
-            {"_id": ObjectId(event_id), **self._base_query(user_id)},
+        # The pre-image gives the exact summary delta; the result is the pre-image plus updates.
+        before = await self.collection.find_one_and_update(
+            {"_id": oid, **self._base_query(user_id)},
             {"$set": updates},
+            projection=_EVENT_PROJECTION,
+            return_document=ReturnDocument.BEFORE,
         )
-        if result.matched_count == 0:
+        if before is None:
             return None
-        return await self.get_event(user_id, event_id)
+        updates.pop("priority_rank", None)
+        after = {**before, **updates}
+        self._invalidate_counts(user_id)
+        await self._apply_summary_delta(user_id, _summary_delta(before, after))
+        return self._doc_to_event(after)
 
     async def delete_event(self, user_id: str, event_id: str) -> bool:
-        if not ObjectId.is_valid(event_id):
+        oid = _parse_object_id(event_id)
+        if oid is None:
             return False
-        now = datetime.now(timezone.utc).isoformat()
-        result = await self.collection.update_one(
-            {"_id": ObjectId(event_id), **self._base_query(user_id)},
+        now = _bson_now()
+        before = await self.collection.find_one_and_update(
+            {"_id": oid, **self._base_query(user_id)},
             {"$set": {"deleted_at": now, "updated_at": now}},
+            projection=_SUMMARY_PROJECTION,
         )
-        return result.modified_count > 0
+        if before is None:
+            return False
+        self._invalidate_counts(user_id)
+        await self._apply_summary_delta(user_id, _summary_delta(before, None))
+        return True
 
     async def get_overview_summary(self, user_id: str) -> dict:
-        query = self._base_query(user_id)
-        total_events = await self.collection.count_documents(query)
-
-        status_rows = await self.collection.aggregate(
-            [{"$match": query}, {"$group": {"_id": "$status", "count": {"$sum": 1}}}]
-        ).to_list(length=20)
-        phase_rows = await self.collection.aggregate(
-            [{"$match": query}, {"$group": {"_id": "$timeline_phase", "count": {"$sum": 1}}}]
-        ).to_list(length=50)
+        summary = await self.summaries.find_one({"_id": user_id})
+        if summary is None or not summary.get("seeded"):
+            return await self._aggregate_overview(user_id)
+        return {
+            "total_events": summary.get("total_events", 0),
+            "by_status": _summary_counts(summary.get("by_status")),
+            "by_timeline_phase": _summary_counts(summary.get("by_timeline_phase")),
+        }
 
-        by_status = {row["_id"]: row["count"] for row in status_rows if row.get("_id")}
-        by_timeline_phase = {row["_id"]: row["count"] for row in phase_rows if row.get("_id")}
+    async def get_financial_summary(self, user_id: str, next_years: int = 5) -> dict:
+        summary = await self.summaries.find_one({"_id": user_id})
+        if summary is None or not summary.get("seeded"):
+            return await self._aggregate_financial(user_id, next_years)
 
+        # Upcoming events depend on today's date, so they are counted rather than stored.
+        today = date.today()
+        end = date(today.year + next_years, 1, 1)
+        upcoming = await self.collection.count_documents(
+            {
+                **self._base_query(user_id),
+                "is_financial": True,
+                "start_date": {"$gte": _to_bson_date(today), "$lt": _to_bson_date(end)},
+            }
+        )
+        target = round(float(summary.get("total_savings_target", 0)), 2)
+        saved = round(float(summary.get("total_amount_saved", 0)), 2)
         return {
-            "total_events": total_events,
-            "by_status": by_status,
-            "by_timeline_phase": by_timeline_phase,
+            "total_savings_target": target or 0.0,
+            "total_amount_saved": saved or 0.0,
+            "fully_funded_events": summary.get("fully_funded_events", 0),
+            "upcoming_financial_events": upcoming,
+            "next_years": next_years,
         }
 
-    async def get_financial_summary(self, user_id: str, next_years: int = 5) -> dict:
-        query = {**self._base_query(user_id), "is_financial": True}
-        docs = await self.collection.find(query).to_list(length=2000)
+    async def rebuild_summary(self, user_id: str) -> None:
+        """Recompute ``user_id``'s summary document from their events.
+
+        Summaries are read from the document only once it is ``seeded`` by this rebuild;
+        until then reads aggregate over the events. Writes for the user racing with the
+        rebuild can be lost or double counted, so run it only while writes are paused.
+        """
+        overview, financial = await asyncio.gather(
+            self._aggregate_overview(user_id), self._aggregate_financial(user_id)
+        )
+        by_status = overview["by_status"]
+        by_phase = overview["by_timeline_phase"]
+        await self.summaries.replace_one(
+            {"_id": user_id},
+            {
+                "seeded": True,
+                "total_events": overview["total_events"],
+                "by_status": {_summary_key(k): v for k, v in by_status.items()},
+                "by_timeline_phase": {_summary_key(k): v for k, v in by_phase.items()},
+                "total_savings_target": financial["total_savings_target"],
+                "total_amount_saved": financial["total_amount_saved"],
+                "fully_funded_events": financial["fully_funded_events"],
+            },
+            upsert=True,
+        )
 
-        total_savings_target = 0.0
-        total_amount_saved = 0.0
-        fully_funded_count = 0
+    async def mark_summaries_seeded(self) -> None:
+        """Record that every existing user's summary has been rebuilt.
 
-        for doc in docs:
-            target = float(doc.get("savings_target") or 0)
-            saved = float(doc.get("amount_saved") or 0)
-            total_savings_target += target
-            total_amount_saved += saved
-            if target > 0 and saved >= target:
-                fully_funded_count += 1
+        Repositories started afterwards create new users' summary documents as seeded.
+        """
+        await self.summaries.replace_one(
+            {"_id": _SUMMARIES_SEEDED_MARKER},
+            {"seeded_at": datetime.now(timezone.utc)},
+            upsert=True,
+        )
+
+    async def _aggregate_overview(self, user_id: str) -> dict:
+        # One streaming $group over (status, phase) pairs; at most a few dozen rows come back
+        # and are folded here, instead of a $facet buffering every event per sub-pipeline.
+        rows = await self.collection.aggregate(
+            [
+                {"$match": self._base_query(user_id)},
+                {
+                    "$group": {
+                        "_id": {"status": "$status", "timeline_phase": "$timeline_phase"},
+                        "count": {"$sum": 1},
+                    }
+                },
+            ]
+        ).to_list(length=None)
+
+        total = 0
+        by_status: dict[str, int] = {}
+        by_phase: dict[str, int] = {}
+        for row in rows:
+            count = row["count"]
+            total += count
+            if status := row["_id"].get("status"):
+                by_status[status] = by_status.get(status, 0) + count
+            if phase := row["_id"].get("timeline_phase"):
+                by_phase[phase] = by_phase.get(phase, 0) + count
+
+        return {
+            "total_events": total,
+            "by_status": by_status,
+            "by_timeline_phase": by_phase,
+        }
 
+    async def _aggregate_financial(self, user_id: str, next_years: int = 5) -> dict:
         today = date.today()
         end = date(today.year + next_years, 1, 1)
-        upcoming_query = {
-            **query,
-            "start_date": {
-                "$gte": today.isoformat(),
-                "$lt": end.isoformat(),
-            },
-        }
-        upcoming_financial_events = await self.collection.count_documents(upcoming_query)
+        target = {"$ifNull": ["$savings_target", 0]}
+        saved = {"$ifNull": ["$amount_saved", 0]}
+
+        rows = await self.collection.aggregate(
+            [
+                {"$match": {**self._base_query(user_id), "is_financial": True}},
+                {
+                    "$group": {
+                        "_id": None,
+                        "total_savings_target": {"$sum": target},
+                        "total_amount_saved": {"$sum": saved},
+                        "fully_funded_events": {
+                            "$sum": {
+                                "$cond": [
+                                    {"$and": [{"$gt": [target, 0]}, {"$gte": [saved, target]}]},
+                                    1,
+                                    0,
+                                ]
+                            }
+                        },
+                        "upcoming_financial_events": {
+                            "$sum": {
+                                "$cond": [
+                                    {
+                                        "$and": [
+                                            {"$gte": ["$start_date", _to_bson_date(today)]},
+                                            {"$lt": ["$start_date", _to_bson_date(end)]},
+                                        ]
+                                    },
+                                    1,
+                                    0,
+                                ]
+                            }
+                        },
+                    }
+                },
+            ]
+        ).to_list(length=1)
+        row = rows[0] if rows else {}
 
         return {
-            "total_savings_target": round(total_savings_target, 2),
-            "total_amount_saved": round(total_amount_saved, 2),
-            "fully_funded_events": fully_funded_count,
-            "upcoming_financial_events": upcoming_financial_events,
+            "total_savings_target": round(float(row.get("total_savings_target", 0)), 2),
+            "total_amount_saved": round(float(row.get("total_amount_saved", 0)), 2),
+            "fully_funded_events": row.get("fully_funded_events", 0),
+            "upcoming_financial_events": row.get("upcoming_financial_events", 0),
             "next_years": next_years,
         }
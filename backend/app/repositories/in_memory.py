@@ -1,10 +1,29 @@
+from bisect import bisect_left, bisect_right, insort
+from collections import Counter
+from collections.abc import Callable, Iterable
 from datetime import date, datetime, timezone
+from itertools import islice
+from operator import attrgetter
+from typing import Any
 from uuid import uuid4
 
-from app.models.event import Event, EventCreate, EventStatus, EventUpdate
+from app.models.event import (
+    Event,
+    EventCreate,
+    EventListItem,
+    EventStatus,
+    EventUpdate,
+)
 from app.repositories.events import SortBy, SortOrder
 
-_PRIORITY_RANK = {"low": 1, "medium": 2, "high": 3, "critical": 4}
+# Ascending sort keys per list ordering; every key ends with the (unique) event id.
+_SORT_INDEX_KEYS: dict[str, Callable[[Event], tuple]] = {
+    "start_date": attrgetter("start_date", "id"),
+    "created_at": attrgetter("created_at", "id"),
+    "priority": lambda event: (event.priority.rank, event.start_date, event.id),
+    # Descending priority still breaks ties by start_date/id ascending.
+    "priority_desc": lambda event: (-event.priority.rank, event.start_date, event.id),
+}
 
 
 class InMemoryEventRepository:
@@ -12,20 +31,69 @@ class InMemoryEventRepository:
 
     def __init__(self) -> None:
         self.events: dict[str, Event] = {}
+        # Secondary indexes over live (not soft-deleted) event ids.
+        self._live_by_user: dict[str, set[str]] = {}
+        self._by_user_status: dict[tuple[str, EventStatus], set[str]] = {}
+        self._by_user_category: dict[tuple[str, str], set[str]] = {}
+        # user_id -> {event_id: (savings_target, amount_saved, fully_funded, start_date)},
+        # plain values extracted once per write for the financial summary.
+        self._financial_rows: dict[str, dict[str, tuple[float, float, bool, date]]] = {}
+        # (user_id, index name) -> sorted keys from _SORT_INDEX_KEYS.
+        self._sorted: dict[tuple[str, str], list[tuple]] = {}
 
     async def ensure_indexes(self) -> None:
         return None
 
+    @staticmethod
+    def _sort_keys(event: Event) -> list[tuple[str, tuple]]:
+        return [(name, key(event)) for name, key in _SORT_INDEX_KEYS.items()]
+
+    def _index(self, event: Event, sort_keys: list[tuple[str, tuple]]) -> None:
+        # Takes keys built by the caller before any state changed, so a key that fails
+        # to build cannot leave an event half-indexed.
+        user_id, event_id = event.user_id, event.id
+        self._live_by_user.setdefault(user_id, set()).add(event_id)
+        self._by_user_status.setdefault((user_id, event.status), set()).add(event_id)
+        category_key = (user_id, event.category)
+        self._by_user_category.setdefault(category_key, set()).add(event_id)
+        if event.is_financial:
+            target = float(event.savings_target or 0)
+            saved = float(event.amount_saved or 0)
+            self._financial_rows.setdefault(user_id, {})[event_id] = (
+                target,
+                saved,
+                target > 0 and saved >= target,
+                event.start_date,
+            )
+        for name, sort_key in sort_keys:
+            insort(self._sorted.setdefault((user_id, name), []), sort_key)
+
+    def _unindex(self, event: Event) -> None:
+        user_id, event_id = event.user_id, event.id
+        self._live_by_user.get(user_id, set()).discard(event_id)
+        self._by_user_status.get((user_id, event.status), set()).discard(event_id)
+        self._by_user_category.get((user_id, event.category), set()).discard(event_id)
+        self._financial_rows.get(user_id, {}).pop(event_id, None)
+        for name, key in _SORT_INDEX_KEYS.items():
+            entries = self._sorted.get((user_id, name), [])
+            event_key = key(event)
+            position = bisect_left(entries, event_key)
+            if position < len(entries) and entries[position] == event_key:
+                del entries[position]
+
     async def create_event(self, payload: EventCreate) -> Event:
         now = datetime.now(timezone.utc)
-        event = Event(
+        # The payload is already validated; build the stored event without re-validating it.
+        event = Event.model_construct(
             id=str(uuid4()),
             created_at=now,
             updated_at=now,
             deleted_at=None,
             **payload.model_dump(),
         )
+        sort_keys = self._sort_keys(event)
         self.events[event.id] = event
+        self._index(event, sort_keys)
         return event
 
     async def list_events(
@@ -38,43 +106,94 @@ class InMemoryEventRepository:
         page_size: int = 20,
         sort_by: SortBy = "start_date",
         sort_order: SortOrder = "asc",
-    ) -> tuple[list[Event], int]:
-        values = [
-            event
-            for event in self.events.values()
-            if event.deleted_at is None and event.user_id == user_id
-        ]
+        after: tuple[Any, ...] | None = None,
+    ) -> tuple[list[EventListItem], int | None, bool]:
+        descending = sort_order == "desc"
+        index_name = (
+            "priority_desc" if sort_by == "priority" and descending else sort_by
+        )
+        key = _SORT_INDEX_KEYS[index_name]
+        reverse = descending and sort_by != "priority"
 
+        candidates: set[str] | None = None
         if status is not None:
-            values = [event for event in values if event.status == status]
+            candidates = self._by_user_status.get((user_id, status), set())
         if category is not None:
-            values = [event for event in values if event.category == category]
-        if year is not None:
-            values = [event for event in values if event.start_date.year == year]
-
-        reverse = sort_order == "desc"
-        if sort_by == "priority":
-            values.sort(
-                key=lambda event: _PRIORITY_RANK[event.priority.value], reverse=reverse
+            by_category = self._by_user_category.get((user_id, category), set())
+            candidates = by_category if candidates is None else candidates & by_category
+
+        if candidates is None:
+            entries = self._sorted.get((user_id, index_name), [])
+        else:
+            # The index sets only hold live events; order just the matching candidates.
+            entries = sorted(key(self.events[event_id]) for event_id in candidates)
+
+        total: int | None
+        if after is not None:
+            total = None
+        elif year is None:
+            total = len(entries)
+        elif candidates is None:
+            by_start = self._sorted.get((user_id, "start_date"), [])
+            total = bisect_left(by_start, (date(year + 1, 1, 1),)) - bisect_left(
+                by_start, (date(year, 1, 1),)
+            )
+        else:
+            total = sum(
+                self.events[event_id].start_date.year == year for event_id in candidates
             )
+
+        skip = (page - 1) * page_size
+        if after is not None:
+            *keys, event_id = after
+            if sort_by == "priority":
+                rank = keys[0].rank if sort_order == "asc" else -keys[0].rank
+                bound = (rank, keys[1], event_id)
+            else:
+                bound = (keys[0], event_id)
+            skip = 0
+            if reverse:
+                stop = bisect_left(entries, bound)
+                ordered: Iterable[tuple] = (entries[i] for i in range(stop - 1, -1, -1))
+            else:
+                ordered = islice(entries, bisect_right(entries, bound), None)
         else:
-            values.sort(key=lambda event: getattr(event, sort_by), reverse=reverse)
+            ordered = reversed(entries) if reverse else entries
 
-        total = len(values)
-        start = (page - 1) * page_size
-        end = start + page_size
-        return values[start:end], total
+        # Walk the ordering and stop once the page plus one look-ahead match is found.
+        page_events: list[Event] = []
+        for entry in ordered:
+            event = self.events[entry[-1]]
+            if year is not None and event.start_date.year != year:
+                continue
+            if skip:
+                skip -= 1
+                continue
+            page_events.append(event)
+            if len(page_events) > page_size:
+                break
 
-    async def get_event(self, user_id: str, event_id: str) -> Event | None:
-        event = self.events.get(event_id)
-        if event is None or event.deleted_at is not None or event.user_id != user_id:
+        has_next = len(page_events) > page_size
+        return (
+            [EventListItem.from_event(event) for event in page_events[:page_size]],
+            total,
+            has_next,
+        )
+
+    def _live_event(self, user_id: str, event_id: str) -> Event | None:
+        # Membership in the user's live set already rules out other users and soft deletes.
+        live = self._live_by_user.get(user_id)
+        if not live or event_id not in live:
             return None
-        return event
+        return self.events[event_id]
+
+    async def get_event(self, user_id: str, event_id: str) -> Event | None:
+        return self._live_event(user_id, event_id)
 
     async def update_event(
         self, user_id: str, event_id: str, payload: EventUpdate
     ) -> Event | None:
-        event = await self.get_event(user_id, event_id)
+        event = self._live_event(user_id, event_id)
         if event is None:
             return None
         updated = event.model_copy(
@@ -83,62 +202,53 @@ class InMemoryEventRepository:
                 "updated_at": datetime.now(timezone.utc),
             }
         )
+        sort_keys = self._sort_keys(updated)
+        self._unindex(event)
         self.events[event_id] = updated
+        self._index(updated, sort_keys)
         return updated
 
     async def delete_event(self, user_id: str, event_id: str) -> bool:
-        event = await self.get_event(user_id, event_id)
+        event = self._live_event(user_id, event_id)
         if event is None:
             return False
+        self._unindex(event)
+        now = datetime.now(timezone.utc)
         self.events[event_id] = event.model_copy(
-            update={
-                "deleted_at": datetime.now(timezone.utc),
-                "updated_at": datetime.now(timezone.utc),
-            }
+            update={"deleted_at": now, "updated_at": now}
         )
         return True
 
     async def get_overview_summary(self, user_id: str) -> dict:
-        rows = [
-            event
-            for event in self.events.values()
-            if event.deleted_at is None and event.user_id == user_id
-        ]
-        by_status: dict[str, int] = {}
-        by_phase: dict[str, int] = {}
-        for row in rows:
-            by_status[row.status.value] = by_status.get(row.status.value, 0) + 1
-            if row.timeline_phase:
-                by_phase[row.timeline_phase] = by_phase.get(row.timeline_phase, 0) + 1
+        total = 0
+        by_status: Counter[str] = Counter()
+        by_phase: Counter[str] = Counter()
+        for event_id in self._live_by_user.get(user_id, ()):
+            event = self.events[event_id]
+            total += 1
+            by_status[event.status.value] += 1
+            if event.timeline_phase:
+                by_phase[event.timeline_phase] += 1
         return {
-            "total_events": len(rows),
-            "by_status": by_status,
-            "by_timeline_phase": by_phase,
+            "total_events": total,
+            "by_status": dict(by_status),
+            "by_timeline_phase": dict(by_phase),
         }
 
     async def get_financial_summary(self, user_id: str, next_years: int = 5) -> dict:
-        rows = [
-            event
-            for event in self.events.values()
-            if event.deleted_at is None
-            and event.user_id == user_id
-            and event.is_financial
-        ]
-
-        total_savings_target = sum(float(event.savings_target or 0) for event in rows)
-        total_amount_saved = sum(float(event.amount_saved or 0) for event in rows)
-        fully_funded_events = sum(
-            1
-            for event in rows
-            if (event.savings_target or 0) > 0
-            and (event.amount_saved or 0) >= (event.savings_target or 0)
-        )
-
+        rows = self._financial_rows.get(user_id, {}).values()
         today = date.today()
         end = date(today.year + next_years, 1, 1)
-        upcoming_financial_events = sum(
-            1 for event in rows if event.start_date >= today and event.start_date < end
-        )
+
+        total_savings_target = 0.0
+        total_amount_saved = 0.0
+        fully_funded_events = 0
+        upcoming_financial_events = 0
+        for target, saved, fully_funded, start_date in rows:
+            total_savings_target += target
+            total_amount_saved += saved
+            fully_funded_events += fully_funded
+            upcoming_financial_events += today <= start_date < end
 
         return {
             "total_savings_target": round(total_savings_target, 2),
@@ -1,4 +1,5 @@
 from datetime import date
+from typing import Any
 
 from app.models.event import (
     Event,
@@ -7,13 +8,25 @@ from app.models.event import (
     EventStatus,
     EventUpdate,
 )
-from app.repositories.events import EventRepository, SortBy, SortOrder
+from app.repositories.events import EventRepository, SortBy, SortOrder, encode_cursor
 from app.services.errors import ServiceValidationError
+from app.services.summary_service import SummaryService
+
+# Update fields that feed each cross-field rule; other patches skip validation and the prefetch.
+_FINANCIAL_FIELDS = frozenset({"is_financial", "savings_target"})
+_TIMING_FIELDS = frozenset({"status", "start_date", "end_date"})
 
 
 class EventService:
-    def __init__(self, repository: EventRepository) -> None:
+    def __init__(
+        self, repository: EventRepository, summary_service: SummaryService | None = None
+    ) -> None:
         self.repository = repository
+        self.summary_service = summary_service
+
+    def _invalidate_summaries(self, user_id: str) -> None:
+        if self.summary_service is not None:
+            self.summary_service.invalidate(user_id)
 
     @staticmethod
     def _validate_financial_requirements(
@@ -35,6 +48,23 @@ class EventService:
                 "completed events cannot have a future start/end date"
             )
 
+    @staticmethod
+    def _financial_rule_needs_existing(changes: dict[str, Any]) -> bool:
+        if "is_financial" in changes and not changes["is_financial"]:
+            return False
+        if changes.get("savings_target") is not None:
+            return False
+        return not _FINANCIAL_FIELDS <= changes.keys()
+
+    @staticmethod
+    def _timing_rule_needs_existing(changes: dict[str, Any]) -> bool:
+        if "status" in changes:
+            if changes["status"] != EventStatus.completed:
+                return False
+            if changes.get("end_date") is not None:
+                return False
+        return not _TIMING_FIELDS <= changes.keys()
+
     async def create_event(self, user_id: str, payload: EventCreate) -> Event:
         self._validate_financial_requirements(
             is_financial=payload.is_financial,
@@ -46,8 +76,11 @@ class EventService:
             end_date=payload.end_date,
         )
 
-        payload = payload.model_copy(update={"user_id": user_id})
-        return await self.repository.create_event(payload)
+        # The payload is parsed per request, so scope it in place rather than copying it.
+        payload.user_id = user_id
+        event = await self.repository.create_event(payload)
+        self._invalidate_summaries(user_id)
+        return event
 
     async def list_events(
         self,
@@ -59,8 +92,9 @@ class EventService:
         page_size: int = 20,
         sort_by: SortBy = "start_date",
         sort_order: SortOrder = "asc",
+        after: tuple[Any, ...] | None = None,
     ) -> EventListResponse:
-        items, total = await self.repository.list_events(
+        items, total, has_next = await self.repository.list_events(
             user_id=user_id,
             status=status,
             category=category,
@@ -69,9 +103,19 @@ class EventService:
             page_size=page_size,
             sort_by=sort_by,
             sort_order=sort_order,
+            after=after,
+        )
+        next_cursor = (
+            encode_cursor(items[-1], sort_by, sort_order) if has_next else None
         )
-        return EventListResponse(
-            items=items, page=page, page_size=page_size, total=total
+        # Every field comes from typed repository output; skip re-validating the envelope.
+        return EventListResponse.model_construct(
+            items=items,
+            page=page,
+            page_size=page_size,
+            total=total,
+            has_next=has_next,
+            next_cursor=next_cursor,
         )
 
     async def get_event(self, user_id: str, event_id: str) -> Event | None:
@@ -80,41 +124,55 @@ class EventService:
     async def update_event(
         self, user_id: str, event_id: str, payload: EventUpdate
     ) -> Event | None:
-        existing = await self.repository.get_event(user_id, event_id)
-        if existing is None:
-            return None
-
-        next_is_financial = (
-            payload.is_financial
-            if payload.is_financial is not None
-            else existing.is_financial
-        )
-        next_savings_target = (
-            payload.savings_target
-            if payload.savings_target is not None
-            else existing.savings_target
-        )
-        self._validate_financial_requirements(
-            is_financial=next_is_financial,
-            savings_target=next_savings_target,
-        )
+        fields = payload.model_fields_set
+        check_financial = not fields.isdisjoint(_FINANCIAL_FIELDS)
+        check_timing = not fields.isdisjoint(_TIMING_FIELDS)
 
-        next_status = payload.status if payload.status is not None else existing.status
-        next_start_date = (
-            payload.start_date
-            if payload.start_date is not None
-            else existing.start_date
-        )
-        next_end_date = (
-            payload.end_date if payload.end_date is not None else existing.end_date
-        )
-        self._validate_completion_timing(
-            status=next_status,
-            start_date=next_start_date,
-            end_date=next_end_date,
-        )
+        if check_financial or check_timing:
+            # Validate the record as it will be stored: set fields override the existing ones.
+            changes = payload.model_dump(exclude_unset=True)
+            existing: Event | None = None
+            if (check_financial and self._financial_rule_needs_existing(changes)) or (
+                check_timing and self._timing_rule_needs_existing(changes)
+            ):
+                existing = await self.repository.get_event(user_id, event_id)
+                if existing is None:
+                    return None
+
+            def resolve(field: str) -> Any:
+                # Unresolved fields only reach rules the patch has already decided.
+                if field in changes:
+                    return changes[field]
+                return getattr(existing, field) if existing is not None else None
+
+            try:
+                if check_financial:
+                    self._validate_financial_requirements(
+                        is_financial=resolve("is_financial"),
+                        savings_target=resolve("savings_target"),
+                    )
+                if check_timing:
+                    self._validate_completion_timing(
+                        status=resolve("status"),
+                        start_date=resolve("start_date"),
+                        end_date=resolve("end_date"),
+                    )
+            except ServiceValidationError:
+                # Without the prefetch the event may not exist; a missing id is a 404.
+                if (
+                    existing is None
+                    and await self.repository.get_event(user_id, event_id) is None
+                ):
+                    return None
+                raise
 
-        return await self.repository.update_event(user_id, event_id, payload)
+        event = await self.repository.update_event(user_id, event_id, payload)
+        if event is not None:
+            self._invalidate_summaries(user_id)
+        return event
 
     async def delete_event(self, user_id: str, event_id: str) -> bool:
-        return await self.repository.delete_event(user_id, event_id)
+        deleted = await self.repository.delete_event(user_id, event_id)
+        if deleted:
+            self._invalidate_summaries(user_id)
+        return deleted
@@ -1,3 +1,5 @@
+from app.core.cache import UserTTLCache
+from app.core.config import get_settings
 from app.models.event import SummaryFinancialResponse, SummaryOverviewResponse
 from app.repositories.events import EventRepository
 
@@ -5,16 +7,41 @@ from app.repositories.events import EventRepository
 class SummaryService:
     def __init__(self, repository: EventRepository) -> None:
         self.repository = repository
+        settings = get_settings()
+        # user_id -> {("overview",) | ("financial", next_years): response}
+        self._cache = UserTTLCache(
+            settings.summary_cache_ttl_seconds, settings.summary_cache_max_users
+        )
+
+    def invalidate(self, user_id: str) -> None:
+        """Drop cached summaries for ``user_id`` after one of their events changed."""
+        self._cache.invalidate(user_id)
 
     async def overview(self, user_id: str) -> SummaryOverviewResponse:
+        key = ("overview",)
+        cached = self._cache.get(user_id, key)
+        if cached is not None:
+            return cached
+
+        stamp = self._cache.stamp()
         data = await self.repository.get_overview_summary(user_id=user_id)
-        return SummaryOverviewResponse(**data)
+        response = SummaryOverviewResponse(**data)
+        self._cache.set(user_id, key, response, stamp)
+        return response
 
     async def financial(
         self, user_id: str, next_years: int = 5
     ) -> SummaryFinancialResponse:
+        key = ("financial", next_years)
+        cached = self._cache.get(user_id, key)
+        if cached is not None:
+            return cached
+
+        stamp = self._cache.stamp()
         data = await self.repository.get_financial_summary(
             user_id=user_id,
             next_years=next_years,
         )
-        return SummaryFinancialResponse(**data)
+        response = SummaryFinancialResponse(**data)
+        self._cache.set(user_id, key, response, stamp)
+        return response
@@ -0,0 +1,39 @@
+"""Recompute the stored ``priority_rank`` sort key from ``priority`` on every event.
+
+The rank is derived server-side, so documents written by other clients (or before the
+field existed) end up with the same ordering as those written by the API.
+
+Usage:
+  python scripts/backfill_priority_rank.py
+"""
+
+from app.core.config import get_settings
+from app.core.event_loop import run
+from app.db.mongo import mongo_manager
+from app.models.event import EventPriority
+
+PRIORITY_RANK_EXPR = {
+    "$switch": {
+        "branches": [
+            {"case": {"$eq": ["$priority", priority.value]}, "then": priority.rank}
+            for priority in EventPriority
+        ],
+        "default": EventPriority.medium.rank,
+    }
+}
+
+
+async def main() -> None:
+    mongo_manager.connect()
+    collection = mongo_manager.db[get_settings().mongo_collection_events]
+
+    result = await collection.update_many(
+        {}, [{"$set": {"priority_rank": PRIORITY_RANK_EXPR}}]
+    )
+    print(f"Updated priority_rank on {result.modified_count} events")
+
+    mongo_manager.close()
+
+
+if __name__ == "__main__":
+    run(main())
@@ -0,0 +1,27 @@
+"""Convert ISO-string date and timestamp fields on events to native BSON dates.
+
+Usage:
+  python scripts/migrate_event_dates.py
+"""
+
+from app.core.config import get_settings
+from app.core.event_loop import run
+from app.db.mongo import mongo_manager
+
+
+async def main() -> None:
+    mongo_manager.connect()
+    collection = mongo_manager.db[get_settings().mongo_collection_events]
+
+    for field in ("start_date", "end_date", "created_at", "updated_at", "deleted_at"):
+        result = await collection.update_many(
+            {field: {"$type": "string"}},
+            [{"$set": {field: {"$dateFromString": {"dateString": f"${field}"}}}}],
+        )
+        print(f"Converted {result.modified_count} {field} values")
+
+    mongo_manager.close()
+
+
+if __name__ == "__main__":
+    run(main())
@@ -0,0 +1,32 @@
+"""Rebuild the per-user ``event_summaries`` documents from the events collection.
+
+The API keeps these documents up to date on every write, but summaries are read from a
+user's document only once a rebuild has seeded it; until then they are aggregated. Run
+this while writes are paused (a write racing with a rebuild can be lost or double
+counted), then restart the API: from then on new users' documents start out seeded. Run
+it again to repair drift from writes made by other clients.
+
+Usage:
+  python scripts/rebuild_event_summaries.py
+"""
+
+from app.core.event_loop import run
+from app.db.mongo import mongo_manager
+from app.repositories.events import MongoEventRepository
+
+
+async def main() -> None:
+    mongo_manager.connect()
+    repository = MongoEventRepository(mongo_manager.db)
+
+    user_ids = await repository.collection.distinct("user_id")
+    for user_id in user_ids:
+        await repository.rebuild_summary(user_id)
+    await repository.mark_summaries_seeded()
+    print(f"Rebuilt event summaries for {len(user_ids)} users")
+
+    mongo_manager.close()
+
+
+if __name__ == "__main__":
+    run(main())
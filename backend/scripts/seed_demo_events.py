@@ -4,8 +4,7 @@ Usage:
   python scripts/seed_demo_events.py
 """
 
-import asyncio
-
+from app.core.event_loop import run
 from app.models.event import EventCreate
 from app.repositories.events import MongoEventRepository
 from app.db.mongo import mongo_manager
@@ -51,12 +50,11 @@ async def main() -> None:
     repo = MongoEventRepository(mongo_manager.db)
     await repo.ensure_indexes()
 
-    for event in EVENTS:
-        await repo.create_event(event)
+    await repo.bulk_create_events(EVENTS)
 
     mongo_manager.close()
     print(f"Seeded {len(EVENTS)} demo events")
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
@@ -0,0 +1,54 @@
+from app.core.cache import UserTTLCache
+
+
+def test_value_computed_across_an_invalidation_is_not_stored() -> None:
+    cache = UserTTLCache(ttl_seconds=60, max_users=10)
+    stamp = cache.stamp()
+    cache.invalidate("rupa")
+    cache.set("rupa", "total", 1, stamp)
+    assert cache.get("rupa", "total") is None
+
+    cache.set("rupa", "total", 2, cache.stamp())
+    assert cache.get("rupa", "total") == 2
+    cache.invalidate("rupa")
+    assert cache.get("rupa", "total") is None
+
+
+def test_users_are_bounded_and_eviction_keeps_the_guard() -> None:
+    cache = UserTTLCache(ttl_seconds=60, max_users=2)
+    stamp = cache.stamp()
+    cache.invalidate("rupa")
+    cache.invalidate("alex")
+    cache.invalidate("sam")
+    assert len(cache._entries) == 2
+
+    # rupa's invalidation record was evicted, but a read that started before it is
+    # still not stored.
+    cache.set("rupa", "total", 1, stamp)
+    assert cache.get("rupa", "total") is None
+    cache.set("rupa", "total", 1, cache.stamp())
+    assert cache.get("rupa", "total") == 1
+    assert len(cache._entries) == 2
+
+
+def test_keys_per_user_are_bounded() -> None:
+    cache = UserTTLCache(ttl_seconds=60, max_users=10, max_keys_per_user=3)
+    for category in range(1000):
+        cache.set("rupa", ("planned", f"category-{category}", None), 1, cache.stamp())
+
+    assert len(cache._entries["rupa"][1]) == 3
+    assert cache.get("rupa", ("planned", "category-999", None)) == 1
+    assert cache.get("rupa", ("planned", "category-0", None)) is None
+
+
+def test_expired_keys_are_dropped_before_live_ones() -> None:
+    cache = UserTTLCache(ttl_seconds=60, max_users=10, max_keys_per_user=2)
+    cache.set("rupa", "live", 1, cache.stamp())
+    cache._ttl = 0
+    cache.set("rupa", "expired", 2, cache.stamp())
+    cache._ttl = 60
+
+    cache.set("rupa", "new", 3, cache.stamp())
+    assert cache.get("rupa", "live") == 1
+    assert cache.get("rupa", "new") == 3
+    assert len(cache._entries["rupa"][1]) == 2
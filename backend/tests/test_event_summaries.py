@@ -0,0 +1,66 @@
+from app.models.event import EventStatus
+from app.repositories.events import (
+    _summary_contribution,
+    _summary_counts,
+    _summary_delta,
+    _summary_key,
+)
+
+_PLANNED_SAVING = {
+    "status": EventStatus.planned,
+    "timeline_phase": "phase.1",
+    "is_financial": True,
+    "savings_target": 100.0,
+    "amount_saved": 40.0,
+}
+
+
+def test_summary_keys_escape_mongo_path_characters_and_round_trip() -> None:
+    assert _summary_key("a.b$c%d") == "a%2Eb%24c%25d"
+    assert _summary_counts({_summary_key("a.b$c%d"): 2, "idle": 0}) == {"a.b$c%d": 2}
+
+
+def test_create_and_delete_deltas_mirror_each_other() -> None:
+    created = _summary_delta(None, _PLANNED_SAVING)
+    assert created == {
+        "total_events": 1,
+        "by_status.planned": 1,
+        "by_timeline_phase.phase%2E1": 1,
+        "total_savings_target": 100.0,
+        "total_amount_saved": 40.0,
+    }
+    deleted = _summary_delta(_PLANNED_SAVING, None)
+    assert deleted == {field: -amount for field, amount in created.items()}
+
+
+def test_update_moves_event_between_status_and_phase_buckets() -> None:
+    after = _PLANNED_SAVING | {"status": EventStatus.completed, "timeline_phase": None}
+    assert _summary_delta(_PLANNED_SAVING, after) == {
+        "by_status.planned": -1,
+        "by_status.completed": 1,
+        "by_timeline_phase.phase%2E1": -1,
+    }
+
+
+def test_update_moves_event_into_and_out_of_financial_totals() -> None:
+    funded = _PLANNED_SAVING | {"amount_saved": 100.0}
+    assert _summary_delta(_PLANNED_SAVING, funded) == {
+        "total_amount_saved": 60.0,
+        "fully_funded_events": 1,
+    }
+
+    not_financial = funded | {"is_financial": False}
+    assert _summary_delta(funded, not_financial) == {
+        "total_savings_target": -100.0,
+        "total_amount_saved": -100.0,
+        "fully_funded_events": -1,
+    }
+    assert _summary_contribution(not_financial) == {
+        "total_events": 1,
+        "by_status.planned": 1,
+        "by_timeline_phase.phase%2E1": 1,
+    }
+
+
+def test_unchanged_summary_fields_produce_no_delta() -> None:
+    assert _summary_delta(_PLANNED_SAVING, _PLANNED_SAVING | {"notes": "x"}) == {}
@@ -1,155 +1,62 @@
+import asyncio
+import base64
+import json
 import os
-from collections.abc import Generator
-from datetime import date, datetime, timezone
-from uuid import uuid4
+from collections.abc import AsyncGenerator
+from datetime import date
 
 os.environ.setdefault("APP_ENV", "test")
 
 import pytest
-from fastapi.testclient import TestClient
+from httpx import ASGITransport, AsyncClient
 
-from app.api.v1.routes_events import get_event_repository
-from app.main import app
-from app.models.event import Event, EventCreate, EventStatus, EventUpdate
+from app.main import app, attach_services
+from app.models.event import EventCreate, EventUpdate
+from app.repositories.in_memory import InMemoryEventRepository
 
+pytestmark = pytest.mark.anyio
 
-class InMemoryEventRepository:
-    def __init__(self) -> None:
-        self.events: dict[str, Event] = {}
 
-    async def ensure_indexes(self) -> None:
-        return None
+@pytest.fixture(scope="module")
+def anyio_backend() -> str:
+    return "asyncio"
 
-    async def create_event(self, payload: EventCreate) -> Event:
-        now = datetime.now(timezone.utc)
-        event = Event(
-            id=str(uuid4()),
-            created_at=now,
-            updated_at=now,
-            deleted_at=None,
-            **payload.model_dump(),
-        )
-        self.events[event.id] = event
-        return event
-
-    async def list_events(
-        self,
-        user_id: str,
-        status: EventStatus | None = None,
-        category: str | None = None,
-        year: int | None = None,
-        page: int = 1,
-        page_size: int = 20,
-        sort_by: str = "start_date",
-        sort_order: str = "asc",
-    ) -> tuple[list[Event], int]:
-        values = [event for event in self.events.values() if event.deleted_at is None and event.user_id == user_id]
-
-        if status is not None:
-            values = [event for event in values if event.status == status]
-        if category is not None:
-            values = [event for event in values if event.category == category]
-        if year is not None:
-            values = [event for event in values if event.start_date.year == year]
-
-        reverse = sort_order == "desc"
-        if sort_by == "priority":
-            rank = {"low": 1, "medium": 2, "high": 3, "critical": 4}
-            values.sort(key=lambda event: rank[event.priority.value], reverse=reverse)
-        else:
-            values.sort(key=lambda event: getattr(event, sort_by), reverse=reverse)
-
-        total = len(values)
-        start = (page - 1) * page_size
-        end = start + page_size
-        return values[start:end], total
-
-    async def get_event(self, user_id: str, event_id: str) -> Event | None:
-        event = self.events.get(event_id)
-        if event is None or event.deleted_at is not None or event.user_id != user_id:
-            return None
-        return event
-
-    async def update_event(self, user_id: str, event_id: str, payload: EventUpdate) -> Event | None:
-        event = self.events.get(event_id)
-        if event is None or event.deleted_at is not None or event.user_id != user_id:
-            return None
-        updated = event.model_copy(
-            update={
-                **payload.model_dump(exclude_unset=True),
-                "updated_at": datetime.now(timezone.utc),
-            }
-        )
-        self.events[event_id] = updated
-        return updated
-
-    async def delete_event(self, user_id: str, event_id: str) -> bool:
-        event = self.events.get(event_id)
-        if event is None or event.deleted_at is not None or event.user_id != user_id:
-            return False
-        self.events[event_id] = event.model_copy(update={"deleted_at": datetime.now(timezone.utc)})
-        return True
-
-    async def get_overview_summary(self, user_id: str) -> dict:
-        rows = [event for event in self.events.values() if event.deleted_at is None and event.user_id == user_id]
-        by_status: dict[str, int] = {}
-        by_phase: dict[str, int] = {}
-        for row in rows:
-            by_status[row.status.value] = by_status.get(row.status.value, 0) + 1
-            if row.timeline_phase:
-                by_phase[row.timeline_phase] = by_phase.get(row.timeline_phase, 0) + 1
-        return {"total_events": len(rows), "by_status": by_status, "by_timeline_phase": by_phase}
-
-    async def get_financial_summary(self, user_id: str, next_years: int = 5) -> dict:
-        rows = [
-            event
-            for event in self.events.values()
-            if event.deleted_at is None and event.user_id == user_id and event.is_financial
-        ]
-        target = sum(float(event.savings_target or 0) for event in rows)
-        saved = sum(float(event.amount_saved or 0) for event in rows)
-        funded = sum(
-            1 for event in rows if (event.savings_target or 0) > 0 and (event.amount_saved or 0) >= (event.savings_target or 0)
-        )
-        return {
-            "total_savings_target": round(target, 2),
-            "total_amount_saved": round(saved, 2),
-            "fully_funded_events": funded,
-            "upcoming_financial_events": len(rows),
-            "next_years": next_years,
-        }
 
+@pytest.fixture(scope="module")
+async def client() -> AsyncGenerator[AsyncClient, None]:
+    # One lifespan for the module; ASGITransport does not run it, so enter it explicitly.
+    async with app.router.lifespan_context(app):
+        transport = ASGITransport(app=app)
+        async with AsyncClient(transport=transport, base_url="http://test") as test_client:
+            yield test_client
 
-@pytest.fixture
-def client() -> Generator[TestClient, None, None]:
-    repository = InMemoryEventRepository()
-    app.dependency_overrides[get_event_repository] = lambda: repository
-
-    with TestClient(app) as test_client:
-        yield test_client
 
+@pytest.fixture(autouse=True)
+def fresh_repository(client: AsyncClient) -> None:
+    # Each test starts from an empty store and empty service caches.
+    attach_services(app, InMemoryEventRepository())
     app.dependency_overrides.clear()
 
 
+_BASE_PAYLOAD = {
+    "category": "education",
+    "status": "planned",
+    "priority": "high",
+    "timeline_phase": "early-career",
+    "is_financial": True,
+    "estimated_cost": 50000,
+    "savings_target": 45000,
+    "actual_cost": 0,
+    "linked_event_ids": [],
+}
+
+
 def _event_payload(title: str, start_date: str, amount_saved: float) -> dict:
-    return {
-        "title": title,
-        "category": "education",
-        "start_date": start_date,
-        "status": "planned",
-        "priority": "high",
-        "timeline_phase": "early-career",
-        "is_financial": True,
-        "estimated_cost": 50000,
-        "savings_target": 45000,
-        "actual_cost": 0,
-        "amount_saved": amount_saved,
-        "linked_event_ids": [],
-    }
-
-
-def test_create_list_get_update_delete_event(client: TestClient) -> None:
-    create_response = client.post(
+    return _BASE_PAYLOAD | {"title": title, "start_date": start_date, "amount_saved": amount_saved}
+
+
+async def test_create_list_get_update_delete_event(client: AsyncClient) -> None:
+    create_response = await client.post(
         "/api/v1/events",
         headers={"X-User-Id": "rupa"},
         json=_event_payload("Start MSc", "2028-09-01", 10000),
@@ -166,17 +73,19 @@ def test_create_list_get_update_delete_event(client: TestClient) -> None:
     assert created["savings_progress_pct"] == 22.22
     assert created["is_fully_funded"] is False
 
-    list_response = client.get("/api/v1/events", headers={"X-User-Id": "rupa"})
+    list_response = await client.get("/api/v1/events", headers={"X-User-Id": "rupa"})
     assert list_response.status_code == 200
     list_body = list_response.json()
     assert any(item["id"] == event_id for item in list_body["items"])
     assert list_body["total"] == 1
+    assert list_body["items"][0]["savings_progress_pct"] == 22.22
+    assert "notes" not in list_body["items"][0]
 
-    get_response = client.get(f"/api/v1/events/{event_id}", headers={"X-User-Id": "rupa"})
+    get_response = await client.get(f"/api/v1/events/{event_id}", headers={"X-User-Id": "rupa"})
     assert get_response.status_code == 200
     assert get_response.json()["category"] == "education"
 
-    update_response = client.patch(
+    update_response = await client.patch(
         f"/api/v1/events/{event_id}",
         headers={"X-User-Id": "rupa"},
         json={"status": "in-progress", "notes": "Accepted offer"},
@@ -185,48 +94,80 @@ def test_create_list_get_update_delete_event(client: TestClient) -> None:
     assert update_response.json()["status"] == "in-progress"
     assert update_response.json()["notes"] == "Accepted offer"
 
-    delete_response = client.delete(f"/api/v1/events/{event_id}", headers={"X-User-Id": "rupa"})
+    delete_response = await client.delete(f"/api/v1/events/{event_id}", headers={"X-User-Id": "rupa"})
     assert delete_response.status_code == 204
 
-    missing_response = client.get(f"/api/v1/events/{event_id}", headers={"X-User-Id": "rupa"})
+    missing_response = await client.get(f"/api/v1/events/{event_id}", headers={"X-User-Id": "rupa"})
     assert missing_response.status_code == 404
 
 
-def test_user_scope_and_summary_endpoints(client: TestClient) -> None:
-    client.post("/api/v1/events", headers={"X-User-Id": "rupa"}, json=_event_payload("Rupa Event", "2028-01-01", 2000))
-    client.post("/api/v1/events", headers={"X-User-Id": "alex"}, json=_event_payload("Alex Event", "2028-02-01", 3000))
+async def test_user_scope_and_summary_endpoints(client: AsyncClient) -> None:
+    await asyncio.gather(
+        client.post(
+            "/api/v1/events",
+            headers={"X-User-Id": "rupa"},
+            json=_event_payload("Rupa Event", "2028-01-01", 2000),
+        ),
+        client.post(
+            "/api/v1/events",
+            headers={"X-User-Id": "alex"},
+            json=_event_payload("Alex Event", "2028-02-01", 3000),
+        ),
+    )
 
-    rupa_events = client.get("/api/v1/events", headers={"X-User-Id": "rupa"})
-    alex_events = client.get("/api/v1/events", headers={"X-User-Id": "alex"})
+    rupa_events, alex_events = await asyncio.gather(
+        client.get("/api/v1/events", headers={"X-User-Id": "rupa"}),
+        client.get("/api/v1/events", headers={"X-User-Id": "alex"}),
+    )
     assert rupa_events.status_code == 200
     assert alex_events.status_code == 200
     assert rupa_events.json()["total"] == 1
     assert alex_events.json()["total"] == 1
 
-    overview = client.get("/api/v1/summary/overview", headers={"X-User-Id": "rupa"})
+    overview, financial = await asyncio.gather(
+        client.get("/api/v1/summary/overview", headers={"X-User-Id": "rupa"}),
+        client.get("/api/v1/summary/financial?next_years=5", headers={"X-User-Id": "rupa"}),
+    )
     assert overview.status_code == 200
     assert overview.json()["total_events"] == 1
 
-    financial = client.get("/api/v1/summary/financial?next_years=5", headers={"X-User-Id": "rupa"})
     assert financial.status_code == 200
     assert financial.json()["total_savings_target"] == 45000.0
     assert financial.json()["total_amount_saved"] == 2000.0
 
 
-def test_filter_pagination_and_sorting(client: TestClient) -> None:
-    client.post("/api/v1/events", json=_event_payload("B Event", "2028-10-01", 1000))
-    client.post("/api/v1/events", json=_event_payload("A Event", "2028-01-01", 2000))
-    client.post("/api/v1/events", json=_event_payload("C Event", "2029-01-01", 46000))
+async def test_summaries_refresh_after_writes(client: AsyncClient) -> None:
+    headers = {"X-User-Id": "rupa"}
+    created = await client.post("/api/v1/events", headers=headers, json=_event_payload("First", "2028-01-01", 2000))
+    assert (await client.get("/api/v1/summary/overview", headers=headers)).json()["total_events"] == 1
+
+    await client.post("/api/v1/events", headers=headers, json=_event_payload("Second", "2028-03-01", 1000))
+    assert (await client.get("/api/v1/summary/overview", headers=headers)).json()["total_events"] == 2
+
+    await client.patch(f"/api/v1/events/{created.json()['id']}", headers=headers, json={"amount_saved": 5000})
+    financial = await client.get("/api/v1/summary/financial", headers=headers)
+    assert financial.json()["total_amount_saved"] == 6000.0
+
+    await client.delete(f"/api/v1/events/{created.json()['id']}", headers=headers)
+    assert (await client.get("/api/v1/summary/overview", headers=headers)).json()["total_events"] == 1
+
+
+async def test_filter_pagination_and_sorting(client: AsyncClient) -> None:
+    await asyncio.gather(
+        client.post("/api/v1/events", json=_event_payload("B Event", "2028-10-01", 1000)),
+        client.post("/api/v1/events", json=_event_payload("A Event", "2028-01-01", 2000)),
+        client.post("/api/v1/events", json=_event_payload("C Event", "2029-01-01", 46000)),
+    )
 
-    filtered_status = client.get("/api/v1/events?status=planned")
+    filtered_status = await client.get("/api/v1/events?status=planned")
     assert filtered_status.status_code == 200
     assert filtered_status.json()["total"] == 3
 
-    filtered_year = client.get("/api/v1/events?year=2028")
+    filtered_year = await client.get("/api/v1/events?year=2028")
     assert filtered_year.status_code == 200
     assert filtered_year.json()["total"] == 2
 
-    paged = client.get("/api/v1/events?page=1&page_size=2&sort_by=start_date&sort_order=asc")
+    paged = await client.get("/api/v1/events?page=1&page_size=2&sort_by=start_date&sort_order=asc")
     assert paged.status_code == 200
     body = paged.json()
     assert body["page"] == 1
@@ -236,8 +177,8 @@ def test_filter_pagination_and_sorting(client: TestClient) -> None:
     assert body["items"][0]["title"] == "A Event"
 
 
-def test_event_date_validation_and_financial_computed_fields(client: TestClient) -> None:
-    response = client.post(
+async def test_event_date_validation_and_financial_computed_fields(client: AsyncClient) -> None:
+    response = await client.post(
         "/api/v1/events",
         json={
             "title": "Invalid Event",
@@ -248,12 +189,12 @@ def test_event_date_validation_and_financial_computed_fields(client: TestClient)
     )
     assert response.status_code == 422
 
-    funded = client.post("/api/v1/events", json=_event_payload("Funded", "2030-01-01", 50000))
+    funded = await client.post("/api/v1/events", json=_event_payload("Funded", "2030-01-01", 50000))
     assert funded.status_code == 201
     assert funded.json()["is_fully_funded"] is True
     assert funded.json()["savings_progress_pct"] == 100.0
 
-    non_financial = client.post(
+    non_financial = await client.post(
         "/api/v1/events",
         json={
             "title": "Health milestone",
@@ -265,3 +206,209 @@ def test_event_date_validation_and_financial_computed_fields(client: TestClient)
     assert non_financial.status_code == 201
     assert non_financial.json()["savings_progress_pct"] is None
     assert non_financial.json()["is_fully_funded"] is None
+
+
+async def test_cursor_pagination(client: AsyncClient) -> None:
+    for title, start_date in [
+        ("A Event", "2028-01-01"),
+        ("B Event", "2028-06-01"),
+        ("C Event", "2028-06-01"),
+        ("D Event", "2029-01-01"),
+        ("E Event", "2030-01-01"),
+    ]:
+        await client.post("/api/v1/events", json=_event_payload(title, start_date, 1000))
+
+    seen: list[str] = []
+    cursor = None
+    for _ in range(3):
+        params = {"page_size": 2, "sort_by": "start_date"}
+        if cursor is not None:
+            params["after"] = cursor
+        response = await client.get("/api/v1/events", params=params)
+        assert response.status_code == 200
+        body = response.json()
+        assert body["total"] == (5 if cursor is None else None)
+        seen.extend(item["title"] for item in body["items"])
+        assert body["has_next"] is (len(seen) < 5)
+        cursor = body["next_cursor"]
+        if cursor is None:
+            break
+
+    assert sorted(seen) == ["A Event", "B Event", "C Event", "D Event", "E Event"]
+    assert len(set(seen)) == 5
+    assert seen[0] == "A Event"
+    assert seen[-1] == "E Event"
+
+    invalid = await client.get("/api/v1/events", params={"after": "not-a-cursor"})
+    assert invalid.status_code == 400
+
+
+async def _walk_titles(client: AsyncClient, params: dict) -> list[str]:
+    titles: list[str] = []
+    cursor = None
+    while True:
+        page_params = params | ({"after": cursor} if cursor is not None else {})
+        body = (await client.get("/api/v1/events", params=page_params)).json()
+        titles.extend(item["title"] for item in body["items"])
+        cursor = body["next_cursor"]
+        if cursor is None:
+            return titles
+
+
+async def test_cursor_pagination_desc_and_priority(client: AsyncClient) -> None:
+    for title, start_date, priority in [
+        ("A Event", "2028-01-01", "low"),
+        ("B Event", "2028-06-01", "critical"),
+        ("C Event", "2029-01-01", "high"),
+        ("D Event", "2029-06-01", "critical"),
+        ("E Event", "2030-01-01", "medium"),
+    ]:
+        await client.post(
+            "/api/v1/events",
+            json=_event_payload(title, start_date, 1000) | {"priority": priority},
+        )
+
+    desc = await _walk_titles(
+        client, {"page_size": 2, "sort_by": "start_date", "sort_order": "desc"}
+    )
+    assert desc == ["E Event", "D Event", "C Event", "B Event", "A Event"]
+
+    by_priority = await _walk_titles(
+        client, {"page_size": 2, "sort_by": "priority", "sort_order": "desc"}
+    )
+    assert by_priority == ["B Event", "D Event", "C Event", "E Event", "A Event"]
+
+    by_priority_asc = await _walk_titles(client, {"page_size": 2, "sort_by": "priority"})
+    assert by_priority_asc == ["A Event", "E Event", "C Event", "B Event", "D Event"]
+
+
+async def test_cursor_from_another_sort_is_rejected(client: AsyncClient) -> None:
+    for title, start_date in [("A Event", "2028-01-01"), ("B Event", "2029-01-01")]:
+        await client.post("/api/v1/events", json=_event_payload(title, start_date, 1000))
+
+    first = await client.get("/api/v1/events", params={"page_size": 1})
+    cursor = first.json()["next_cursor"]
+
+    other_sort = await client.get(
+        "/api/v1/events", params={"after": cursor, "sort_by": "created_at"}
+    )
+    assert other_sort.status_code == 400
+    other_order = await client.get(
+        "/api/v1/events", params={"after": cursor, "sort_order": "desc"}
+    )
+    assert other_order.status_code == 400
+
+    naive = base64.urlsafe_b64encode(
+        json.dumps(["created_at", "asc", "2028-01-01T00:00:00", "x"]).encode()
+    ).decode()
+    naive_response = await client.get(
+        "/api/v1/events", params={"after": naive, "sort_by": "created_at"}
+    )
+    assert naive_response.status_code == 400
+
+
+async def test_service_rules_are_rejected_with_422(client: AsyncClient) -> None:
+    missing_target = await client.post(
+        "/api/v1/events",
+        json={
+            "title": "Emergency fund",
+            "category": "finance",
+            "start_date": "2029-01-01",
+            "is_financial": True,
+        },
+    )
+    assert missing_target.status_code == 422
+    assert missing_target.json()["detail"] == "financial events must include savings_target"
+
+    future_completed = await client.post(
+        "/api/v1/events",
+        json={
+            "title": "Graduation",
+            "category": "education",
+            "start_date": "2099-01-01",
+            "status": "completed",
+        },
+    )
+    assert future_completed.status_code == 422
+
+
+async def test_update_rules_only_run_for_relevant_fields(client: AsyncClient) -> None:
+    created = await client.post("/api/v1/events", json=_event_payload("Course", "2099-01-01", 1000))
+    event_id = created.json()["id"]
+
+    notes_only = await client.patch(f"/api/v1/events/{event_id}", json={"notes": "enrolled"})
+    assert notes_only.status_code == 200
+    assert notes_only.json()["notes"] == "enrolled"
+
+    completed_early = await client.patch(f"/api/v1/events/{event_id}", json={"status": "completed"})
+    assert completed_early.status_code == 422
+
+    dropped_target = await client.patch(f"/api/v1/events/{event_id}", json={"savings_target": None})
+    assert dropped_target.status_code == 422
+
+    completed_in_future = await client.patch(
+        f"/api/v1/events/{event_id}", json={"status": "completed", "end_date": "2099-06-01"}
+    )
+    assert completed_in_future.status_code == 422
+
+    not_financial = await client.patch(f"/api/v1/events/{event_id}", json={"is_financial": False})
+    assert not_financial.status_code == 200
+    assert not_financial.json()["savings_progress_pct"] is None
+
+    cleared_target = await client.patch(
+        f"/api/v1/events/{event_id}", json={"is_financial": True, "savings_target": None}
+    )
+    assert cleared_target.status_code == 422
+
+    missing = await client.patch("/api/v1/events/does-not-exist", json={"notes": "x"})
+    assert missing.status_code == 404
+
+    missing_with_rules = await client.patch(
+        "/api/v1/events/does-not-exist", json={"status": "planned", "savings_target": 10}
+    )
+    assert missing_with_rules.status_code == 404
+
+    for invalid_patch in (
+        {"is_financial": True, "savings_target": None},
+        {"status": "completed", "end_date": "2099-01-01"},
+    ):
+        missing_invalid = await client.patch(
+            "/api/v1/events/does-not-exist", json=invalid_patch
+        )
+        assert missing_invalid.status_code == 404
+
+
+async def test_null_for_required_fields_is_rejected_and_event_survives(
+    client: AsyncClient,
+) -> None:
+    created = await client.post(
+        "/api/v1/events", json=_event_payload("Trip", "2029-01-01", 0)
+    )
+    event_id = created.json()["id"]
+
+    for field in ("priority", "start_date", "status", "category", "title"):
+        response = await client.patch(f"/api/v1/events/{event_id}", json={field: None})
+        assert response.status_code == 422
+
+    assert (await client.get(f"/api/v1/events/{event_id}")).status_code == 200
+    renamed = await client.patch(f"/api/v1/events/{event_id}", json={"title": "Trek"})
+    assert renamed.status_code == 200
+    listed = await client.get("/api/v1/events", params={"sort_by": "priority"})
+    assert [item["title"] for item in listed.json()["items"]] == ["Trek"]
+    assert (await client.get("/api/v1/summary/overview")).json()["total_events"] == 1
+
+
+async def test_in_memory_update_failure_leaves_indexes_intact() -> None:
+    repository = InMemoryEventRepository()
+    event = await repository.create_event(
+        EventCreate(title="Trip", category="travel", start_date="2029-01-01")
+    )
+    # Bypasses EventUpdate validation to reach the repository with an unsortable value.
+    payload = EventUpdate.model_construct(priority=None, _fields_set={"priority"})
+    with pytest.raises(AttributeError):
+        await repository.update_event(event.user_id, event.id, payload)
+
+    assert await repository.get_event(event.user_id, event.id) is event
+    items, total, _ = await repository.list_events(event.user_id, sort_by="priority")
+    assert [item.id for item in items] == [event.id]
+    assert total == 1
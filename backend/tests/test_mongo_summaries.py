@@ -0,0 +1,110 @@
+import asyncio
+from datetime import datetime, timezone
+
+import pytest
+
+from app.models.event import EventCreate
+from app.repositories.events import MongoEventRepository
+
+mongomock_motor = pytest.importorskip("mongomock_motor")
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture(scope="module")
+def anyio_backend() -> str:
+    return "asyncio"
+
+
+@pytest.fixture
+async def repository() -> MongoEventRepository:
+    client = mongomock_motor.AsyncMongoMockClient(tz_aware=True)
+    repository = MongoEventRepository(client["sanchara"])
+    await repository.ensure_indexes()
+    return repository
+
+
+def _payload(user_id: str, title: str) -> EventCreate:
+    return EventCreate(
+        user_id=user_id,
+        title=title,
+        category="finance",
+        start_date="2030-01-01",
+        is_financial=True,
+        savings_target=100,
+        amount_saved=40,
+    )
+
+
+async def _create_with_delayed_summary_update(
+    repository: MongoEventRepository, user_id: str
+) -> None:
+    """Create two events where the first one's summary $inc lands after the second."""
+    update_one = repository.summaries.update_one
+    release = asyncio.Event()
+    held: list[bool] = []
+
+    async def hold_first_update(*args, **kwargs):
+        if not held:
+            held.append(True)
+            await release.wait()
+        return await update_one(*args, **kwargs)
+
+    repository.summaries.update_one = hold_first_update
+    first = asyncio.create_task(repository.create_event(_payload(user_id, "First")))
+    while not held:
+        await asyncio.sleep(0)
+    # The first event is stored; its summary delta is still in flight.
+    await repository.create_event(_payload(user_id, "Second"))
+    release.set()
+    await first
+    repository.summaries.update_one = update_one
+
+
+async def test_racing_first_writes_for_existing_user_keep_summaries_exact(
+    repository: MongoEventRepository,
+) -> None:
+    # An event written before summaries were tracked.
+    now = datetime.now(timezone.utc)
+    older = MongoEventRepository._new_document(_payload("rupa", "Older"), now)
+    await repository.collection.insert_one(older)
+
+    await _create_with_delayed_summary_update(repository, "rupa")
+
+    overview = await repository.get_overview_summary("rupa")
+    financial = await repository.get_financial_summary("rupa")
+    assert overview["total_events"] == 3
+    assert financial["total_amount_saved"] == 120.0
+
+    # Seeded by a rebuild, later racing writes are applied on top exactly once.
+    await repository.rebuild_summary("rupa")
+    await _create_with_delayed_summary_update(repository, "rupa")
+    summary = await repository.summaries.find_one({"_id": "rupa"})
+    assert summary["seeded"] is True
+    assert (await repository.get_overview_summary("rupa"))["total_events"] == 5
+
+
+async def test_new_users_start_seeded_once_every_summary_was_rebuilt(
+    repository: MongoEventRepository,
+) -> None:
+    await repository.mark_summaries_seeded()
+    await repository.ensure_indexes()
+
+    await _create_with_delayed_summary_update(repository, "alex")
+
+    summary = await repository.summaries.find_one({"_id": "alex"})
+    assert summary["seeded"] is True
+    assert summary["total_events"] == 2
+    assert (await repository.get_overview_summary("alex"))["by_status"] == {
+        "planned": 2
+    }
+
+
+async def test_summaries_stay_unseeded_before_a_full_rebuild(
+    repository: MongoEventRepository,
+) -> None:
+    await repository.create_event(_payload("sam", "Only"))
+
+    summary = await repository.summaries.find_one({"_id": "sam"})
+    assert summary["seeded"] is False
+    assert (await repository.get_overview_summary("sam"))["total_events"] == 1